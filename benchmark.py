@@ -0,0 +1,460 @@
+"""
+File Name: benchmark.py
+
+Description: Reproducible benchmark suite for board generation, flood fill and rendering. Times
+BoardManager.initialize_board, place_mines, calculate_adjacent_counts, GameLogic.reveal_cell (a single numbered cell and
+the worst-case cascade over the whole board), check_victory and UserInterface.update_board, over a range of board sizes
+and mine densities with fixed seeds, and records the peak memory of a generated board and the start-up time of the
+terminal frontend (launch to first frame, main.py --tui). Every timing is the median of
+several runs with the setup left out, and quick benchmarks are timed over many calls so timer noise doesn't dominate.
+Results are written to JSON and compared against a stored baseline, and any benchmark that got slower (or bigger) by
+more than the threshold is reported as a regression. A slowdown must also be bigger than an absolute noise floor and
+show up again when the benchmark is re-run, and timings under a microsecond per call are reported but never fail the
+comparison: on a busy machine run-to-run jitter on an unchanged tree is well past the threshold.
+
+update_board needs a display. Run the suite under a virtual display (xvfb-run python benchmark.py) to include it,
+otherwise the rendering benchmarks are skipped. Results missing from the baseline fail the comparison as "no baseline",
+and --save-baseline merges into the stored baseline, so xvfb-run python benchmark.py --save-baseline adds the rendering
+results to a baseline recorded headless.
+
+Run with: python benchmark.py                          (compare against benchmark_baseline.json)
+          python benchmark.py --save-baseline          (store this machine's results as the new baseline)
+          python benchmark.py --sizes 10 50 --board CompactBoardManager --output results.json
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- benchmark.py -----
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import board_manager
+from game_logic import GameLogic
+from stats_store import StatsStore
+
+# Source: Original work
+SEED = 20261018  # Every board in the suite is built from this seed
+SIZES = (10, 50, 200, 1000)
+DENSITIES = (0.10, 0.15, 0.20)
+BOARDS = ("BoardManager", "CompactBoardManager", "ArrayBoardManager")
+REPEAT = 5  # Runs per benchmark, the median counts
+LARGE_REPEAT = 2  # Runs per benchmark on boards over LARGE_SIZE, where one run already takes seconds
+LARGE_SIZE = 200
+MIN_TIME = 0.05  # Shortest timing in seconds, quicker benchmarks are looped up to this
+MAX_LOOP = 10000  # Most calls looped into one timing
+BUTTON_UI_MAX_SIZE = 50  # The button grid is one Tk widget per cell, bigger boards only use the canvas renderer
+THRESHOLD = 0.25  # Fraction slower than the baseline that counts as a regression
+NOISE_FLOOR = {"seconds": 20e-6, "bytes": 4096}  # Smallest absolute difference that can count as a regression
+UNGATED_SECONDS = 1e-6  # Timings this short (per call) are reported but left out of the comparison
+CONFIRM_RUNS = 2  # Re-runs of the benchmarks that look slower, a regression has to show up in every run
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+# Source: Original work
+def median_time(run, setup=None, repeat=REPEAT):
+    """
+    Times a function, leaving its setup out of the measurement. Fast functions are timed over several calls (each
+    after its own setup) until a timing lasts at least MIN_TIME, so timer noise doesn't dominate. The median of the
+    timings is steadier between runs of the suite than the fastest one.
+
+    Input: Function to time (called with setup's result), optional setup function run before every call, number of timings
+
+    Output: Median time per call in seconds
+    """
+    def timed(number):
+        total = 0.0
+        gc.collect()
+        gc.disable() # Same as timeit, a collection in the middle of a run would be charged to whatever triggered it
+        try:
+            for _ in range(number):
+                state = setup() if setup else None
+                started = time.perf_counter()
+                run(state)
+                total += time.perf_counter() - started
+        finally:
+            gc.enable()
+        return total / number
+
+    # The first call warms up caches and lazy imports, and tells how many calls make a long enough timing
+    first = timed(1)
+    number = min(MAX_LOOP, max(1, int(MIN_TIME / first) if first > 0 else MAX_LOOP))
+    return statistics.median(timed(number) for _ in range(repeat))
+
+# Source: Original work
+def peak_memory(run):
+    # Peak bytes allocated while run() executes (what it keeps alive plus its temporaries)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = run()
+        return tracemalloc.get_traced_memory()[1], kept
+    finally:
+        tracemalloc.stop()
+
+# Source: Original work
+def new_game(board_class, size, mine_count):
+    # A generated board (first click in the middle) wrapped in a game that is ready to play
+    board = board_class(size, seed=SEED)
+    board.initialize_board(mine_count, safe_cell=(size // 2, size // 2), seed=SEED)
+    game = GameLogic(board)
+    game.start_game(mine_count)
+    game.board_generated()
+    return game
+
+# Source: Original work
+def cascade_game(board_class, size):
+    # Worst case for the flood fill: a single mine in a corner, so clicking the opposite corner reveals every other cell
+    board = board_class(size, seed=SEED)
+    board.load_layout([(size - 1, size - 1)], seed=SEED)
+    game = GameLogic(board)
+    game.start_game(1)
+    game.board_generated()
+    return game
+
+# Source: Original work
+def numbered_cell(game):
+    # First covered safe cell with a number, so revealing it never cascades (fixed for a fixed seed)
+    size = game.board.size
+    for r in range(size):
+        for c in range(size):
+            cell = game.board.get_cell(r, c)
+            if not cell.is_mine and cell.adjacent:
+                return r, c
+    return size // 2, size // 2
+
+# Source: Original work
+def board_benchmarks(board_class, size, density, repeat):
+    """
+    Runs the board and game logic benchmarks for one board type, size and density.
+
+    Input: Board class, board size, mine density and runs per benchmark
+
+    Output: Dict of benchmark name -> {"seconds": ...} or {"bytes": ...}
+    """
+    mine_count = max(1, round(size * size * density))
+    center = (size // 2, size // 2)
+    results = {}
+
+    def fresh_board():
+        return board_class(size, seed=SEED)
+
+    def empty_board():
+        board = board_class(size, seed=SEED)
+        board.initialize_board(0, seed=SEED)
+        return board
+
+    results["initialize_board"] = {"seconds": median_time(
+        lambda board: board.initialize_board(mine_count, safe_cell=center, seed=SEED), fresh_board, repeat)}
+    results["place_mines"] = {"seconds": median_time(
+        lambda board: board.place_mines(mine_count, center, random.Random(SEED)), empty_board, repeat)}
+    game = new_game(board_class, size, mine_count)
+    results["calculate_adjacent_counts"] = {"seconds": median_time(lambda _: game.board.calculate_adjacent_counts(), repeat=repeat)}
+
+    # A numbered cell never cascades, so covering it again between runs puts the game back where it was
+    target = numbered_cell(game)
+    def cover_target():
+        cell = game.board.get_cell(*target)
+        if not cell.is_covered:
+            cell.is_covered = True
+            game.covered_safe += 1
+        return target
+    results["reveal_cell_single"] = {"seconds": median_time(lambda cell: game.reveal_cell(*cell), cover_target, repeat)}
+
+    # check_victory is a handful of instructions, so it is timed over a loop of calls
+    calls = 1000
+    def check_loop(_):
+        for _ in range(calls):
+            game.check_victory()
+    results["check_victory"] = {"seconds": median_time(check_loop, repeat=repeat) / calls}
+
+    def generate():
+        board = fresh_board()
+        board.initialize_board(mine_count, safe_cell=center, seed=SEED)
+        return board
+    results["board_memory"] = {"bytes": peak_memory(generate)[0]}
+    return results
+
+# Source: Original work
+def cascade_benchmark(board_class, size, repeat):
+    # Full-board cascade from one corner, independent of the density
+    return {"seconds": median_time(lambda game: game.reveal_cell(0, 0), lambda: cascade_game(board_class, size), repeat)}
+
+# Source: Original work
+def open_display():
+    # A hidden Tk root, or None when there is no display (or no Tk) to render on
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:  # ImportError without Tk, TclError without a display
+        return None
+    root.withdraw()
+    return root
+
+# Source: Original work
+def render_benchmarks(root, board_class, size, repeat):
+    """
+    Times update_board on the button grid (small boards) and the canvas renderer: a full redraw of a fresh board, and
+    a redraw of just the cells a worst-case cascade changed.
+
+    Input: Tk root, board class, board size and runs per benchmark
+
+    Output: Dict of benchmark name -> {"seconds": ...}
+    """
+    from canvas_interface import CanvasUserInterface
+    from user_interface import UserInterface
+
+    results = {}
+    renderers = [("canvas", CanvasUserInterface)]
+    if size <= BUTTON_UI_MAX_SIZE:
+        renderers.insert(0, ("buttons", UserInterface))
+    for name, ui_class in renderers:
+        def setup(cascade):
+            for child in root.winfo_children():
+                child.destroy()
+            game = cascade_game(board_class, size) if cascade else new_game(board_class, size, max(1, size * size // 7))
+            ui = ui_class(root, game, None)
+            ui.build_board()
+            root.update()
+            changed = game.reveal_cell(0, 0) if cascade else None
+            return ui, changed
+
+        def draw(state):
+            state[0].update_board(state[1])
+            root.update_idletasks() # Count the work Tk does for the redraw, not just the calls that queue it
+
+        results[f"update_board_full_{name}"] = {"seconds": median_time(draw, lambda: setup(False), repeat)}
+        results[f"update_board_cascade_{name}"] = {"seconds": median_time(draw, lambda: setup(True), repeat)}
+    return results
+
+# Source: Original work
+def startup_benchmark(repeat):
+    """
+    Time from launch to first frame of the terminal frontend: runs python main.py --tui --first-frame-exit in a
+    pseudo-terminal, interpreter start-up and opening the stats database included. The database is a temporary one
+    that already exists, like on any launch after the first.
+
+    Input: Number of runs
+
+    Output: {"seconds": median run}, or None where there are no pseudo-terminals (Windows)
+    """
+    try:
+        import fcntl
+        import pty
+        import struct
+        import subprocess
+        import tempfile
+        import termios
+        import threading
+    except ImportError:
+        return None
+    main_py = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    env = dict(os.environ, TERM=os.environ.get("TERM") or "xterm")
+
+    def drain(fd):
+        # Keep reading the terminal output, a full pty buffer would block the game mid-frame
+        try:
+            while os.read(fd, 65536):
+                pass
+        except OSError: # EIO once the game exits and closes its end
+            pass
+
+    timings = []
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "stats.db")
+        StatsStore(database).close()
+        for _ in range(repeat):
+            master, slave = pty.openpty()
+            fcntl.ioctl(slave, termios.TIOCSWINSZ, struct.pack("HHHH", 24, 80, 0, 0)) # A new pty is 0x0
+            reader = threading.Thread(target=drain, args=(master,), daemon=True)
+            started = time.perf_counter()
+            process = subprocess.Popen([sys.executable, main_py, "--tui", "--first-frame-exit", "--stats", database],
+                                       stdin=slave, stdout=slave, stderr=slave, env=env)
+            reader.start()
+            process.wait(timeout=30)
+            timings.append(time.perf_counter() - started)
+            os.close(slave)
+            reader.join(1)
+            os.close(master)
+    return {"seconds": statistics.median(timings)}
+
+# Source: Original work
+def run_suite(sizes=SIZES, densities=DENSITIES, boards=BOARDS, repeat=REPEAT, render=True, log=print):
+    """
+    Runs every benchmark for every board type, size and density.
+
+    Input: Board sizes, mine densities, board class names, runs per benchmark, whether to try the rendering benchmarks, and a progress printer
+
+    Output: Dict of "board/benchmark/size[/density]" -> measurement
+    """
+    results = {}
+    root = open_display() if render else None
+    if render and root is None:
+        log("No display available, skipping update_board (run under xvfb-run to include it)")
+    try:
+        for board_name in boards:
+            board_class = getattr(board_manager, board_name)
+            if board_name == "ArrayBoardManager" and board_manager.load_numpy() is None:
+                log("NumPy not installed, skipping ArrayBoardManager")
+                continue
+            for size in sizes:
+                runs = repeat if size <= LARGE_SIZE else min(repeat, LARGE_REPEAT)
+                log(f"{board_name} {size}x{size}")
+                for density in densities:
+                    for name, value in board_benchmarks(board_class, size, density, runs).items():
+                        results[f"{board_name}/{name}/{size}/{density:.2f}"] = value
+                results[f"{board_name}/reveal_cell_cascade/{size}"] = cascade_benchmark(board_class, size, runs)
+                if root is not None:
+                    for name, value in render_benchmarks(root, board_class, size, runs).items():
+                        results[f"{board_name}/{name}/{size}"] = value
+    finally:
+        if root is not None:
+            root.destroy()
+    startup = startup_benchmark(repeat)
+    if startup is not None:
+        results["tui/startup"] = startup
+    return results
+
+# Source: Original work
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Compares results with a baseline. A regression is slower (or bigger) than the baseline by more than the threshold
+    and by more than the metric's NOISE_FLOOR; sub-microsecond timings (UNGATED_SECONDS) are never compared. A result
+    the baseline has no value for is reported too (baseline value and ratio None), so a benchmark can't go unchecked
+    just because the baseline was recorded without it (e.g. without a display for update_board).
+
+    Input: Results and baseline dicts (as produced by run_suite), and the allowed fraction of slowdown
+
+    Output: List of (key, metric, baseline value, new value, ratio) for every regression, worst first, then the
+        results without a baseline
+    """
+    regressions = []
+    missing = []
+    for key, measured in results.items():
+        expected = baseline.get(key, {})
+        for metric, value in measured.items():
+            old = expected.get(metric)
+            if old is None:
+                missing.append((key, metric, None, value, None))
+                continue
+            if not old or (metric == "seconds" and max(old, value) < UNGATED_SECONDS):
+                continue
+            if value - old > max(old * threshold, NOISE_FLOOR.get(metric, 0)):
+                regressions.append((key, metric, old, value, value / old))
+    regressions.sort(key=lambda regression: regression[4], reverse=True)
+    return regressions + sorted(missing)
+
+# Source: Original work
+def confirm(results, baseline, regressions, threshold, repeat, log=print):
+    """
+    Re-runs the benchmarks behind the regressions (CONFIRM_RUNS times at most) and keeps the faster measurement of
+    each, so a benchmark that was only slowed down by the machine once drops out.
+
+    Input: Results and baseline dicts, the regressions found in them, allowed fraction of slowdown, runs per benchmark,
+        and a progress printer
+
+    Output: Regressions that were slower in every run (the results are updated in place)
+    """
+    for _ in range(CONFIRM_RUNS):
+        if not regressions:
+            break
+        keys = {key for key, _, old, _, _ in regressions if old is not None} # Re-running can't give a result a baseline
+        if not keys:
+            break
+        log(f"Re-running {len(keys)} benchmark(s) that look slower")
+        boards, sizes, densities = set(), set(), set()
+        for key in keys:
+            parts = key.split("/")
+            if parts[0] in BOARDS:
+                boards.add(parts[0])
+                sizes.add(int(parts[2]))
+                densities.update(float(density) for density in parts[3:])
+        render = any("/update_board_" in key for key in keys)
+        again = run_suite(sorted(sizes), sorted(densities), sorted(boards), repeat, render, log=lambda *_: None)
+        for key in keys:
+            for metric, value in again.get(key, {}).items():
+                results[key][metric] = min(results[key][metric], value)
+        regressions = compare(results, baseline, threshold)
+    return regressions
+
+# Source: Original work
+def format_value(metric, value):
+    # Human-readable time or size
+    if metric == "bytes":
+        return f"{value / 1024:,.1f} KiB"
+    if value < 1e-3:
+        return f"{value * 1e6:,.2f} us"
+    return f"{value * 1e3:,.2f} ms"
+
+# Source: Original work
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Minesweeper benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="board sizes to run")
+    parser.add_argument("--densities", type=float, nargs="+", default=list(DENSITIES), help="mine densities to run")
+    parser.add_argument("--board", nargs="+", default=list(BOARDS), choices=BOARDS, help="board classes to run")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="runs per benchmark, the median counts")
+    parser.add_argument("--no-render", action="store_true", help="skip the update_board benchmarks")
+    parser.add_argument("--output", default=None, help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="slowdown fraction that counts as a regression (default 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results in the baseline instead of comparing (benchmarks not run keep their old values)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.densities, args.board, args.repeat, not args.no_render)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": SEED,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+
+    if args.save_baseline:
+        # Merged into the stored results, so e.g. xvfb-run python benchmark.py --save-baseline can add the rendering
+        # benchmarks to a baseline recorded without a display
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                report["results"] = dict(json.load(f)["results"], **results)
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+        print(f"Saved {len(results)} results in the baseline {args.baseline}")
+        return 0
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = confirm(results, baseline, compare(results, baseline, args.threshold), args.threshold, args.repeat)
+    for key, measured in sorted(results.items()):
+        print(f"{key:<60} " + "  ".join(format_value(metric, value) for metric, value in measured.items()))
+    if baseline is None:
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+        return 0
+    slower = [regression for regression in regressions if regression[2] is not None]
+    if slower:
+        print(f"{len(slower)} regression(s) beyond {args.threshold:.0%}:")
+    for key, metric, old, value, ratio in regressions:
+        if old is None:
+            print(f"  {key:<58} no baseline ({format_value(metric, value)}), add it with --save-baseline")
+        else:
+            print(f"  {key:<58} {format_value(metric, old)} -> {format_value(metric, value)} ({ratio:.2f}x)")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
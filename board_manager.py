@@ -3,6 +3,8 @@ File Name: board_manager.py
 
 Description: File that defines the Cell class, which represents individual cells on the board, and the BoardManager class.
 BoardManager handles board initialization, random mine placement, adjacent mine calculations, cell access, and board resets. 
+ArrayBoardManager is an alternate NumPy-backed board that stores the cell state in parallel arrays for very large boards.
+CompactBoardManager packs each cell into a single byte of a bytearray, so boards with tens of millions of cells fit in a few tens of MB.
 
 
 All Collaborators: Group 4, ChatGPT
@@ -15,10 +17,84 @@ Last Updated: 9/16/2025
 """
 # ----- board_manager.py -----
 import random
+from array import array
+from itertools import compress
+
+np = None  # NumPy module once load_numpy() has run; optional, only ArrayBoardManager needs it
+
+# Source: Original work
+# Bit layout of one cell in CompactBoardManager: mine/covered/flagged flags in the low bits, adjacent count in the high 4 bits
+MINE_BIT = 0x01
+COVERED_BIT = 0x02
+FLAGGED_BIT = 0x04
+ADJACENT_SHIFT = 4
+FLAG_MASK = 0x0F
+CLEAR_ADJACENT = bytes(b & FLAG_MASK for b in range(256))  # bytes.translate table that zeroes every adjacent count
+DIRTY_PAGE_SHIFT = 12  # Changed cells are tracked per 4 KiB page of the packed array (see save_game.py)
+MINE_ONLY = bytes(b & MINE_BIT for b in range(256))  # bytes.translate table: 1 for a mine byte, 0 otherwise
+NOT_MINE_MASK = bytes(0 if b & MINE_BIT else 0xFF for b in range(256))  # 0xFF for every byte that is not a mine
+NOT_MINE_BYTES = bytes(b for b in range(256) if not b & MINE_BIT)  # Deleting these leaves one byte per mine
+ADJACENT_BAND = 1 << 20  # Cells per band in CompactBoardManager.calculate_adjacent_counts
+DENSE_SAMPLING = 16  # sample_mine_indices tracks picks in a bytearray once mines are at least 1/16 of the free cells
+
+# Source: Original work
+def load_numpy():
+    # Import NumPy on first use, importing it up front would add ~100 ms to every start-up. Returns None without NumPy.
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+# Source: Original work
+def sample_mine_indices(total, mine_count, rng, excluded=()):
+    """
+    Picks mine_count distinct flat indices in range(total) that are not in `excluded`, using Floyd's algorithm.
+
+    The excluded indices are skipped by remapping a smaller virtual range, so no list of positions is ever built and the
+    cost only depends on the number of mines.
+
+    Input: Number of cells, number of mines, random.Random instance, flat indices that must stay mine-free
+
+    Output: Sorted array('q') of flat indices
+    """
+    excluded = sorted(set(excluded))
+    available = total - len(excluded)
+    if not 0 <= mine_count <= available:
+        raise ValueError(f"Cannot place {mine_count} mines in {available} free cells")
+    if mine_count * DENSE_SAMPLING >= available:
+        # Dense boards: one byte per free cell instead of a set of Python ints (same draws, so the same layout)
+        chosen = bytearray(available)
+        for j in range(available - mine_count, available):
+            pick = rng.randrange(j + 1)
+            chosen[j if chosen[pick] else pick] = 1
+        # Inserting a 0 at every excluded position turns the virtual range back into board positions
+        for index in excluded:
+            chosen[index:index] = b"\0"
+        return array("q", compress(range(total), chosen))
+    chosen = set()
+    for j in range(available - mine_count, available):
+        pick = rng.randrange(j + 1)
+        chosen.add(j if pick in chosen else pick)
+    if not excluded:
+        return array("q", sorted(chosen))
+    # Walk the sorted picks and the sorted exclusions together, every exclusion at or below a pick pushes it up by one
+    result = array("q")
+    skipped = 0
+    for index in sorted(chosen):
+        while skipped < len(excluded) and excluded[skipped] <= index + skipped:
+            skipped += 1
+        result.append(index + skipped)
+    return result
 
 # Class representing an individual cell. The minesweeper board is a 10x10 grid of these cells.
 # Source: Original work
 class Cell:
+    __slots__ = ("is_mine", "is_covered", "is_flagged", "adjacent")  # No per-instance __dict__, cuts each cell to a fraction of the size
+
     def __init__(self, is_mine = False, is_covered = True, is_flagged = False, adjacent = 0):
         self.is_mine = is_mine
         self.is_covered = is_covered
@@ -27,30 +103,144 @@ class Cell:
 
 class BoardManager:
     # Source: ChatGPT
-    def __init__(self, size=10):
+    def __init__(self, size=10, seed=None, rng=None, safe_neighborhood=False, no_guess=False):
         #Intialize the board variables and size
         self.size = size
         self.board = []
         self.mines = set()
+        self.rng = rng or random.Random(seed) # Draws the seed of every board this manager generates
+        self.seed = None # Seed of the current board, initialize_board with the same seed and safe cell rebuilds the same layout
+        self.safe_neighborhood = safe_neighborhood # Keep the whole 3x3 around the first click mine-free, not just the cell
+        self.no_guess = no_guess # Only generate boards that can be solved from the safe cell without guessing
+        self.generation_stats = None # GenerationStats of the last no-guess board (see no_guess.py)
+
+    # Source: Original work
+    def choose_seed(self, mine_count, safe_cell, seed):
+        # Seed for the next board: the given one, a no-guess board's seed, or a fresh one
+        if seed is not None:
+            return seed
+        if self.no_guess and safe_cell is not None:
+            # Imported here because no_guess.py plays candidate boards with GameLogic, which imports this module
+            from no_guess import MAX_CANDIDATES, TIME_BUDGET, generate_no_guess
+            seed, self.generation_stats = generate_no_guess(self.size, mine_count, safe_cell, self.safe_neighborhood, seed=self.rng.randrange(2**63),
+                                                            max_candidates=MAX_CANDIDATES, time_budget=TIME_BUDGET)
+            if seed is not None:
+                return seed
+        return self.rng.randrange(2**63)
 
     # Source: Original work combined with ChatGPT
-    def initialize_board(self, mine_count, safe_cell=None):
+    def initialize_board(self, mine_count, safe_cell=None, seed=None):
         # Populate the board with cells and place mines
+        self.seed = self.choose_seed(mine_count, safe_cell, seed)
         self.board = [[Cell()
                        for _ in range(self.size)] for _ in range(self.size)] #Create a 2d array of default cell objects
-        self.place_mines(mine_count, safe_cell) #Place mines on the board
-        self.calculate_adjacent_counts() #Calculate adjacent mine counts for each cell
+        self.place_layout(mine_count, safe_cell) #Place mines on the board and count their neighbors
 
-    # Source: ChatGPT
-    def place_mines(self, mine_count, safe_cell=None):
+    # Source: Original work
+    def place_layout(self, mine_count, safe_cell):
+        """
+        Places the mines from the board's seed alone, then moves any out of the safe zone. The board pool builds boards
+        before the first click and adapts them with the same relocate_mines call, so a layout is always rebuilt by
+        initialize_board(mine_count, first click, seed), whichever way it was made.
+
+        Input: Number of mines, and the first clicked (row, col) or None
+
+        Output: None
+        """
+        self.place_mines(mine_count, None, random.Random(self.seed))
+        self.calculate_adjacent_counts()
+        if safe_cell is not None:
+            self.relocate_mines(safe_cell)
+
+    # Source: Original work
+    def load_layout(self, mines, seed=None):
+        # Build the board from a known set of (row, col) mine positions instead of random placement (used by replays)
+        self.initialize_board(0, seed=seed)
+        for r, c in mines:
+            self.get_cell(r, c).is_mine = True
+        self.mines = set(mines)
+        self.calculate_adjacent_counts()
+
+    # Source: Original work
+    def count_mines(self):
+        # Number of mines on the current board
+        return len(self.mines)
+
+    # Source: Original work
+    def mine_indices(self):
+        # Sorted flat indices of every mine
+        return sorted(r * self.size + c for r, c in self.mines)
+
+    # Source: Original work
+    def set_mine(self, row, col, value):
+        # Add or remove one mine, keeping the cell and the layout set in step (the adjacent counts are left to the caller)
+        self.get_cell(row, col).is_mine = value
+        if value:
+            self.mines.add((row, col))
+        else:
+            self.mines.discard((row, col))
+
+    # Source: Original work
+    def safe_indices(self, mine_count, safe_cell):
+        # Flat indices that must not get a mine: the safe cell, plus its neighbors if there is room for all the mines
+        if not safe_cell:
+            return []
+        row, col = safe_cell
+        if not self.safe_neighborhood:
+            return [row * self.size + col]
+        zone = [r * self.size + c for r in range(max(row-1, 0), min(row+2, self.size))
+                for c in range(max(col-1, 0), min(col+2, self.size))]
+        return zone if self.size * self.size - len(zone) >= mine_count else [row * self.size + col]
+
+    # Source: Original work combined with ChatGPT
+    def place_mines(self, mine_count, safe_cell=None, rng=None):
         # Randomly place mines on the board, avoiding the safe_cell if provided
-        positions = [(r, c) for r in range(self.size) for c in range(self.size)] #List of all possible positions
-        if safe_cell and safe_cell in positions:
-            positions.remove(safe_cell)#Remove the safe cell from possible mine positions
-        self.mines = set(random.sample(positions, mine_count)) #Randomly select mine positions
+        flat = sample_mine_indices(self.size * self.size, mine_count, rng or self.rng, self.safe_indices(mine_count, safe_cell))
+        self.mines = {divmod(i, self.size) for i in flat} #Convert flat indices to (row, col) positions
         for r, c in self.mines: #For each randomly selected position
             self.board[r][c].is_mine = True #Mark the cell as a mine
 
+    # Source: Original work
+    def relocate_mines(self, safe_cell, rng=None):
+        """
+        Moves any mine in the safe zone of an already generated board to a random free cell outside it, so a board built
+        before the first click can still guarantee a safe first click. Only the counts around the moved mines are redone.
+
+        Input: The first clicked (row, col) and an optional random.Random (defaults to one seeded from the board's seed)
+
+        Output: List of (old position, new position) moves
+        """
+        rng = rng or random.Random(self.seed)
+        zone = {divmod(i, self.size) for i in self.safe_indices(self.count_mines(), safe_cell)}
+        is_mine = lambda cell: self.get_cell(*cell).is_mine
+        moves = []
+        for source in sorted(cell for cell in zone if is_mine(cell)):
+            target = None
+            for _ in range(64): # Random probing is enough unless the board is nearly all mines
+                probe = (rng.randrange(self.size), rng.randrange(self.size))
+                if probe not in zone and not is_mine(probe):
+                    target = probe
+                    break
+            if target is None:
+                free = [(r, c) for r in range(self.size) for c in range(self.size) if (r, c) not in zone and not is_mine((r, c))]
+                if not free:
+                    break
+                target = rng.choice(free)
+            self.set_mine(*source, False)
+            self.set_mine(*target, True)
+            moves.append((source, target))
+
+        # Recount every cell whose 3x3 neighborhood contains a moved mine
+        touched = {(r, c) for move in moves for row, col in move
+                   for r in range(max(row-1, 0), min(row+2, self.size)) for c in range(max(col-1, 0), min(col+2, self.size))}
+        for r, c in touched:
+            cell = self.get_cell(r, c)
+            cell.adjacent = 0 if cell.is_mine else sum(
+                1 for nr in range(max(r-1, 0), min(r+2, self.size))
+                for nc in range(max(c-1, 0), min(c+2, self.size)) if is_mine((nr, nc))
+            )
+        return moves
+
     # Source: ChatGPT
     def calculate_adjacent_counts(self):
         # Calculate the number of adjacent mines for each cell
@@ -75,3 +265,253 @@ class BoardManager:
         # Reset the board to an empty state
         self.board = []
         self.mines.clear()
+
+# Lightweight stand-in for a Cell that reads and writes straight through to the ArrayBoardManager arrays.
+# Source: Original work
+class CellView:
+    __slots__ = ("_board", "_row", "_col")
+
+    def __init__(self, board, row, col):
+        self._board = board
+        self._row = row
+        self._col = col
+
+    @property
+    def is_mine(self):
+        return bool(self._board.mine[self._row, self._col])
+
+    @is_mine.setter
+    def is_mine(self, value):
+        self._board.mine[self._row, self._col] = value
+
+    @property
+    def is_covered(self):
+        return bool(self._board.covered[self._row, self._col])
+
+    @is_covered.setter
+    def is_covered(self, value):
+        self._board.covered[self._row, self._col] = value
+
+    @property
+    def is_flagged(self):
+        return bool(self._board.flagged[self._row, self._col])
+
+    @is_flagged.setter
+    def is_flagged(self, value):
+        self._board.flagged[self._row, self._col] = value
+
+    @property
+    def adjacent(self):
+        return int(self._board.adjacent[self._row, self._col])
+
+    @adjacent.setter
+    def adjacent(self, value):
+        self._board.adjacent[self._row, self._col] = value
+
+# Board stored as parallel NumPy arrays (mine, covered, flagged, adjacent) instead of a 2D list of Cell objects.
+# Adjacent counts are computed in one vectorized pass, so very large boards are set up in milliseconds.
+# The mine layout lives in the mine array only, like CompactBoardManager's bytes (no set of (row, col) tuples).
+# Source: Original work
+class ArrayBoardManager(BoardManager):
+    def __init__(self, size=10, seed=None, rng=None, safe_neighborhood=False, no_guess=False):
+        if load_numpy() is None:
+            raise ImportError("ArrayBoardManager requires NumPy (pip install numpy)")
+        self.mine = None
+        super().__init__(size, seed, rng, safe_neighborhood, no_guess)
+        self.mine = None
+        self.covered = None
+        self.flagged = None
+        self.adjacent = None
+
+    def initialize_board(self, mine_count, safe_cell=None, seed=None):
+        # Allocate the parallel arrays, then place mines and count neighbors
+        self.seed = self.choose_seed(mine_count, safe_cell, seed)
+        shape = (self.size, self.size)
+        self.mine = np.zeros(shape, dtype=bool)
+        self.covered = np.ones(shape, dtype=bool)
+        self.flagged = np.zeros(shape, dtype=bool)
+        self.adjacent = np.zeros(shape, dtype=np.uint8)
+        self.place_layout(mine_count, safe_cell)
+
+    def place_mines(self, mine_count, safe_cell=None, rng=None):
+        # Same sampling as BoardManager, written into the mine array in one go
+        flat = np.array(sample_mine_indices(self.size * self.size, mine_count, rng or self.rng, self.safe_indices(mine_count, safe_cell)), dtype=np.int64)
+        self.mine.flat[flat] = True
+
+    @property
+    def mines(self):
+        # Built on demand from the mine array, not kept
+        return {divmod(i, self.size) for i in self.mine_indices()}
+
+    @mines.setter
+    def mines(self, value):
+        pass # BoardManager.__init__ and load_layout assign a set, the mine array already says the same
+
+    def count_mines(self):
+        return 0 if self.mine is None else int(np.count_nonzero(self.mine))
+
+    def mine_indices(self):
+        if self.mine is None:
+            return array("q")
+        return array("q", np.flatnonzero(self.mine).astype(np.int64).tobytes())
+
+    def set_mine(self, row, col, value):
+        self.mine[row, col] = value
+
+    def calculate_adjacent_counts(self):
+        # Sum the 9 shifted copies of a zero-padded mine array, then zero out the mine cells themselves
+        padded = np.pad(self.mine.astype(np.uint8), 1)
+        counts = np.zeros((self.size, self.size), dtype=np.uint8)
+        for dr in range(3):
+            for dc in range(3):
+                counts += padded[dr:dr + self.size, dc:dc + self.size]
+        counts[self.mine] = 0
+        self.adjacent = counts
+
+    def get_cell(self, row, col):
+        # Return a view that reads/writes the arrays at the specified position
+        return CellView(self, row, col)
+
+    def reset_board(self):
+        super().reset_board()
+        self.mine = None
+        self.covered = None
+        self.flagged = None
+        self.adjacent = None
+
+# Proxy for one byte of a CompactBoardManager, with the same attribute names as Cell.
+# Source: Original work
+class PackedCell:
+    __slots__ = ("_cells", "_index", "_dirty")
+
+    def __init__(self, cells, index, dirty=None):
+        self._cells = cells
+        self._index = index
+        self._dirty = dirty
+
+    def _set(self, bit, value):
+        if value:
+            self._cells[self._index] |= bit
+        else:
+            self._cells[self._index] &= ~bit & 0xFF
+        if self._dirty is not None:
+            self._dirty.add(self._index >> DIRTY_PAGE_SHIFT)
+
+    @property
+    def is_mine(self):
+        return bool(self._cells[self._index] & MINE_BIT)
+
+    @is_mine.setter
+    def is_mine(self, value):
+        self._set(MINE_BIT, value)
+
+    @property
+    def is_covered(self):
+        return bool(self._cells[self._index] & COVERED_BIT)
+
+    @is_covered.setter
+    def is_covered(self, value):
+        self._set(COVERED_BIT, value)
+
+    @property
+    def is_flagged(self):
+        return bool(self._cells[self._index] & FLAGGED_BIT)
+
+    @is_flagged.setter
+    def is_flagged(self, value):
+        self._set(FLAGGED_BIT, value)
+
+    @property
+    def adjacent(self):
+        return self._cells[self._index] >> ADJACENT_SHIFT
+
+    @adjacent.setter
+    def adjacent(self, value):
+        self._cells[self._index] = (self._cells[self._index] & FLAG_MASK) | (value << ADJACENT_SHIFT)
+        if self._dirty is not None:
+            self._dirty.add(self._index >> DIRTY_PAGE_SHIFT)
+
+# Board stored as one byte per cell in a flat bytearray (row-major): bit 0 mine, bit 1 covered, bit 2 flagged, bits 4-7 adjacent count.
+# Source: Original work
+class CompactBoardManager(BoardManager):
+    def __init__(self, size=10, seed=None, rng=None, safe_neighborhood=False, no_guess=False):
+        self.cells = bytearray()
+        super().__init__(size, seed, rng, safe_neighborhood, no_guess)
+        self.dirty_pages = None # Page numbers written through get_cell since the last save, None when not tracking
+
+    # The layout lives in the mine bits only, a set of (row, col) tuples would take ~100 bytes per mine
+    @property
+    def mines(self):
+        # Built on demand from the packed bytes, not kept
+        size = self.size
+        return {divmod(i, size) for i in self.mine_indices()}
+
+    @mines.setter
+    def mines(self, value):
+        pass # BoardManager.__init__ and load_layout assign a set, the mine bits already say the same
+
+    def count_mines(self):
+        return len(bytes(self.cells).translate(None, NOT_MINE_BYTES))
+
+    def mine_indices(self):
+        return array("q", compress(range(len(self.cells)), bytes(self.cells).translate(MINE_ONLY)))
+
+    def set_mine(self, row, col, value):
+        self.get_cell(row, col).is_mine = value
+
+    def track_changes(self):
+        # Start (or restart) recording which pages of the packed array get written
+        self.dirty_pages = set()
+
+    def initialize_board(self, mine_count, safe_cell=None, seed=None):
+        # Every cell starts covered with no mine and no neighbors
+        self.seed = self.choose_seed(mine_count, safe_cell, seed)
+        self.cells = bytearray([COVERED_BIT]) * (self.size * self.size)
+        self.place_layout(mine_count, safe_cell)
+
+    def place_mines(self, mine_count, safe_cell=None, rng=None):
+        # Same sampling as BoardManager, written straight into the packed bytes
+        flat = sample_mine_indices(self.size * self.size, mine_count, rng or self.rng, self.safe_indices(mine_count, safe_cell))
+        cells = self.cells
+        for i in flat:
+            cells[i] |= MINE_BIT
+
+    def calculate_adjacent_counts(self):
+        """
+        Recomputes every adjacent count without a Python loop per cell or per mine. The mine bits are laid out one byte
+        per cell with a zero border around every row, read as one big integer, and summed with shifted copies of
+        itself (by one byte for the left/right neighbors, by one padded row for the ones above/below). A count is at
+        most 9, so no byte ever carries into the next. The board is done in bands of about ADJACENT_BAND cells, which
+        keeps the temporary integers small.
+
+        Input: None
+
+        Output: None
+        """
+        size = self.size
+        stride = size + 2
+        band = max(1, ADJACENT_BAND // size)
+        for top in range(0, size, band):
+            bottom = min(top + band, size)
+            first, last = max(top - 1, 0), min(bottom + 1, size) # One extra row on each side for the neighbors
+            cells = bytes(self.cells[top * size:bottom * size])
+            mines = bytes(self.cells[first * size:last * size]).translate(MINE_ONLY)
+            rows = b"\0\0".join(mines[r * size:(r + 1) * size] for r in range(last - first))
+            padded = b"\0" * (stride + 1) + rows + b"\0" * (stride + 1)
+            total = int.from_bytes(padded, "little")
+            total += (total << 8) + (total >> 8)
+            total += (total << 8 * stride) + (total >> 8 * stride)
+            counts = (total & ((1 << 8 * len(padded)) - 1)).to_bytes(len(padded), "little")
+            counts = b"".join(counts[(r - first + 1) * stride + 1:(r - first + 1) * stride + 1 + size] for r in range(top, bottom))
+            # Mine cells keep an adjacent count of 0, same as the other boards
+            counts = int.from_bytes(counts, "little") & int.from_bytes(cells.translate(NOT_MINE_MASK), "little")
+            packed = int.from_bytes(cells.translate(CLEAR_ADJACENT), "little") | (counts << ADJACENT_SHIFT)
+            self.cells[top * size:bottom * size] = packed.to_bytes(len(cells), "little")
+
+    def get_cell(self, row, col):
+        # Return a proxy for the byte at the specified position
+        return PackedCell(self.cells, row * self.size + col, self.dirty_pages)
+
+    def reset_board(self):
+        self.cells = bytearray()
+        super().reset_board()
@@ -0,0 +1,115 @@
+"""
+File Name: board_pool.py
+
+Description: Background pre-generation of boards, so the first click never has to build a board inside the Tk event
+handler. A worker thread keeps a few ready boards for every (size, mine_count) that was asked for (only one for big
+boards, a 1000x1000 BoardManager is ~94 MB), the number of keys is bounded with least-recently-used eviction, and a ready board is adapted to the first click by moving any mine out
+of the safe zone (BoardManager.relocate_mines).
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- board_pool.py -----
+import random
+import threading
+from collections import OrderedDict, deque
+
+from board_manager import BoardManager
+
+class BoardPool:
+    """
+    Pool of pre-generated boards keyed by (size, mine_count).
+
+    Call prefetch() as soon as the board settings are known (GameLogic.start_game does this) and take() on the first
+    click. take() never generates a board itself; it returns None when nothing is ready and the caller falls back to
+    generating one.
+    """
+
+    # Source: Original work
+    def __init__(self, factory=BoardManager, capacity=2, max_keys=4, seed=None, max_cells=1_000_000):
+        self.factory = factory  # Board class (or any callable taking (size, seed=...)) used to build boards
+        self.capacity = capacity  # Ready boards kept per key
+        self.max_cells = max_cells  # Cells kept ready per key, fewer boards are kept for big sizes (always at least one)
+        self.max_keys = max_keys  # Distinct (size, mine_count) keys kept before the least recently used one is dropped
+        self.rng = random.Random(seed)  # Seeds for the generated boards
+        self.ready = OrderedDict()  # (size, mine_count) -> deque of ready boards, least recently used first
+        self.condition = threading.Condition()  # Guards `ready` and wakes the worker when a key needs boards
+        self.closed = False
+        self.worker = threading.Thread(target=self.run, name="BoardPool", daemon=True)
+        self.worker.start()
+
+    # Source: Original work
+    def prefetch(self, size, mine_count):
+        # Ask for boards with these settings, evicting the least recently used settings if there are too many
+        with self.condition:
+            key = (size, mine_count)
+            self.ready.setdefault(key, deque())
+            self.ready.move_to_end(key)
+            while len(self.ready) > self.max_keys:
+                self.ready.popitem(last=False)
+            self.condition.notify()
+
+    # Source: Original work
+    def take(self, size, mine_count, safe_cell):
+        """
+        Takes a ready board and makes the safe cell (and its neighborhood if the board asks for it) mine-free.
+
+        Input: Board size, number of mines, and the first clicked (row, col)
+
+        Output: A generated board, or None if none is ready yet
+        """
+        with self.condition:
+            key = (size, mine_count)
+            boards = self.ready.get(key)
+            board = boards.popleft() if boards else None
+            if boards is not None:
+                self.ready.move_to_end(key)
+            self.condition.notify() # Refill what was just taken
+        if board is not None:
+            board.relocate_mines(safe_cell)
+        return board
+
+    # Source: Original work
+    def close(self):
+        # Stop the worker thread
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.worker.join()
+
+    # Source: Original work
+    def capacity_for(self, size):
+        # Ready boards kept for one key of this size
+        return max(1, min(self.capacity, self.max_cells // (size * size)))
+
+    # Source: Original work
+    def next_request(self):
+        # Most recently used key that is below capacity, or None
+        for key in reversed(self.ready):
+            if len(self.ready[key]) < self.capacity_for(key[0]):
+                return key
+        return None
+
+    # Source: Original work
+    def run(self):
+        # Worker loop: build boards outside the lock, then hand them over if their key is still wanted
+        while True:
+            with self.condition:
+                key = self.next_request()
+                while key is None and not self.closed:
+                    self.condition.wait()
+                    key = self.next_request()
+                if self.closed:
+                    return
+                seed = self.rng.randrange(2**63)
+            size, mine_count = key
+            board = self.factory(size, seed=seed)
+            board.initialize_board(mine_count)
+            with self.condition:
+                if key in self.ready:
+                    self.ready[key].append(board)
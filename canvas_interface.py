@@ -0,0 +1,222 @@
+"""
+File Name: canvas_interface.py
+
+Description: Alternate board renderer for large grids. Instead of one tk.Button per cell, the whole board is drawn on a single
+tk.Canvas and only the cells inside the visible viewport are drawn. Clicks are mapped from canvas coordinates to (row, col),
+and the board can be scrolled (mouse wheel / scrollbars) and zoomed (Ctrl + mouse wheel). Build time and Tk memory use
+depend on the window size, not on the number of cells.
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- canvas_interface.py -----
+import tkinter as tk
+
+from instrumentation import stats
+from user_interface import NUMBER_COLORS, UserInterface
+
+# Source: Original work
+# Cell size in pixels and the zoom limits
+CELL_SIZE = 28
+MIN_CELL_SIZE = 8
+MAX_CELL_SIZE = 64
+ZOOM_STEP = 1.25
+
+# Source: Original work
+# Canvas colors
+COVERED_COLOR = "gray70"
+REVEALED_COLOR = "lightgrey"
+GRID_COLOR = "gray45"
+
+# Source: Original work
+# (fill, text, text color) for a covered cell that has not been flagged
+COVERED_STYLE = (COVERED_COLOR, "", "black")
+
+class CanvasUserInterface(UserInterface):
+    """
+    UserInterface that draws the board on a single virtualized tk.Canvas.
+
+    Keeps the same header, status bar and game-over flow as UserInterface, and only replaces the grid of buttons.
+    """
+
+    # Source: Original work
+    def __init__(self, root, game_logic, input_handler):
+        super().__init__(root, game_logic, input_handler)
+        self.cell_size = CELL_SIZE  # Current zoom level in pixels per cell
+        self.drawn = {}  # (row, col) -> [rectangle id, text id, style] for every cell currently on the canvas
+        self.view = None  # (first row, last row, first col, last col) range that is currently drawn
+        self.redraw_pending = False  # True while a viewport redraw is queued for the next idle cycle
+
+        # Canvas with scrollbars fills the grid frame
+        self.grid_frame.pack_configure(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(self.grid_frame, highlightthickness=0, bg=REVEALED_COLOR)
+        self.xbar = tk.Scrollbar(self.grid_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.ybar = tk.Scrollbar(self.grid_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.config(xscrollcommand=self.on_xscroll, yscrollcommand=self.on_yscroll)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.ybar.grid(row=0, column=1, sticky="ns")
+        self.xbar.grid(row=1, column=0, sticky="ew")
+        self.grid_frame.rowconfigure(0, weight=1)
+        self.grid_frame.columnconfigure(0, weight=1)
+
+        # Clicks are mapped from canvas coordinates to cells
+        self.canvas.bind("<Button-1>", lambda e: self.on_click(e, self.input.handle_left_click))
+        self.canvas.bind("<Button-3>", lambda e: self.on_click(e, self.input.handle_right_click))
+        self.canvas.bind("<Button-2>", lambda e: self.on_click(e, self.input.handle_right_click))
+        self.canvas.bind("<Double-Button-1>", lambda e: self.on_click(e, self.input.handle_chord))
+        self.canvas.bind("<Configure>", lambda e: self.schedule_redraw())
+
+        # Mouse wheel scrolls, Shift + wheel scrolls sideways, Ctrl + wheel zooms (Button-4/5 are the wheel on X11)
+        self.canvas.bind("<MouseWheel>", lambda e: self.scroll(self.canvas.yview_scroll, -e.delta))
+        self.canvas.bind("<Shift-MouseWheel>", lambda e: self.scroll(self.canvas.xview_scroll, -e.delta))
+        self.canvas.bind("<Control-MouseWheel>", lambda e: self.zoom(e, ZOOM_STEP if e.delta > 0 else 1 / ZOOM_STEP))
+        self.canvas.bind("<Button-4>", lambda e: self.scroll(self.canvas.yview_scroll, -1))
+        self.canvas.bind("<Button-5>", lambda e: self.scroll(self.canvas.yview_scroll, 1))
+        self.canvas.bind("<Shift-Button-4>", lambda e: self.scroll(self.canvas.xview_scroll, -1))
+        self.canvas.bind("<Shift-Button-5>", lambda e: self.scroll(self.canvas.xview_scroll, 1))
+        self.canvas.bind("<Control-Button-4>", lambda e: self.zoom(e, ZOOM_STEP))
+        self.canvas.bind("<Control-Button-5>", lambda e: self.zoom(e, 1 / ZOOM_STEP))
+
+    # Source: Original work
+    def build_board(self):
+        # Reset the canvas for a new board, nothing is drawn until the viewport is known
+        self.clear_board_widgets()
+        total = self.game.board.size * self.cell_size
+        self.canvas.config(scrollregion=(0, 0, total, total), xscrollincrement=self.cell_size, yscrollincrement=self.cell_size,
+                           width=min(total, 800), height=min(total, 600))
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+        self.schedule_redraw()
+
+    # Source: Original work
+    def clear_board_widgets(self):
+        # Remove every drawn cell, the canvas itself is kept
+        self.canvas.delete("all")
+        self.drawn = {}
+        self.view = None
+
+    # Source: Original work
+    def update_size(self, event=None):
+        # The canvas resizes with the window on its own and redraws from its <Configure> binding
+        pass
+
+    # Source: Original work
+    def on_xscroll(self, first, last):
+        # Keep the scrollbar in sync and redraw once the view settles
+        self.xbar.set(first, last)
+        self.schedule_redraw()
+
+    # Source: Original work
+    def on_yscroll(self, first, last):
+        # Keep the scrollbar in sync and redraw once the view settles
+        self.ybar.set(first, last)
+        self.schedule_redraw()
+
+    # Source: Original work
+    def scroll(self, view_scroll, amount):
+        # Scroll by whole cells, MouseWheel deltas come in multiples of 120 on Windows and small steps on macOS
+        if amount:
+            view_scroll(max(-3, min(3, amount if abs(amount) < 120 else amount // 120)), "units")
+
+    # Source: Original work
+    def zoom(self, event, factor):
+        # Change the cell size while keeping the cell under the mouse in place
+        new_size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, round(self.cell_size * factor)))
+        if new_size == self.cell_size:
+            return
+        board_x = self.canvas.canvasx(event.x) / self.cell_size
+        board_y = self.canvas.canvasy(event.y) / self.cell_size
+        self.cell_size = new_size
+        total = self.game.board.size * new_size
+        self.clear_board_widgets()
+        self.canvas.config(scrollregion=(0, 0, total, total), xscrollincrement=new_size, yscrollincrement=new_size)
+        self.canvas.xview_moveto(max(board_x * new_size - event.x, 0) / total)
+        self.canvas.yview_moveto(max(board_y * new_size - event.y, 0) / total)
+        self.schedule_redraw()
+
+    # Source: Original work
+    def on_click(self, event, handler):
+        # Convert the click position into a (row, col) and pass it on to the input handler
+        row = int(self.canvas.canvasy(event.y) // self.cell_size)
+        col = int(self.canvas.canvasx(event.x) // self.cell_size)
+        if 0 <= row < self.game.board.size and 0 <= col < self.game.board.size:
+            handler(row, col)
+
+    # Source: Original work
+    def schedule_redraw(self):
+        # Collapse bursts of scroll/resize events into a single redraw
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.root.after_idle(self.redraw_viewport)
+
+    # Source: Original work
+    def redraw_viewport(self):
+        # Draw the cells that scrolled into view and delete the ones that scrolled out
+        self.redraw_pending = False
+        size = self.game.board.size
+        px = self.cell_size
+        first_row = max(int(self.canvas.canvasy(0) // px), 0)
+        first_col = max(int(self.canvas.canvasx(0) // px), 0)
+        last_row = min(int(self.canvas.canvasy(self.canvas.winfo_height()) // px) + 1, size)
+        last_col = min(int(self.canvas.canvasx(self.canvas.winfo_width()) // px) + 1, size)
+        view = (first_row, last_row, first_col, last_col)
+        if view == self.view:
+            return
+
+        for key in [key for key in self.drawn if not (first_row <= key[0] < last_row and first_col <= key[1] < last_col)]:
+            rect, text, _ = self.drawn.pop(key)
+            self.canvas.delete(rect, text)
+        for r in range(first_row, last_row):
+            for c in range(first_col, last_col):
+                if (r, c) not in self.drawn:
+                    self.draw_cell(r, c)
+        self.view = view
+
+    # Source: Original work
+    def cell_style(self, row, col):
+        # (fill, text, text color) that shows the current state of a cell
+        if self.game.first_click:
+            return COVERED_STYLE  # The board is only generated on the first click
+        cell = self.game.board.get_cell(row, col)
+        if cell.is_covered:
+            return (COVERED_COLOR, "🚩", "red") if cell.is_flagged else COVERED_STYLE
+        if cell.is_mine:
+            return (REVEALED_COLOR, "💣", "red")
+        if cell.adjacent > 0:
+            return (REVEALED_COLOR, str(cell.adjacent), NUMBER_COLORS[cell.adjacent])
+        return (REVEALED_COLOR, "", "black")
+
+    # Source: Original work
+    def draw_cell(self, row, col):
+        # Create the rectangle and text items for one cell
+        px = self.cell_size
+        x, y = col * px, row * px
+        fill, text, color = style = self.cell_style(row, col)
+        rect = self.canvas.create_rectangle(x, y, x + px, y + px, fill=fill, outline=GRID_COLOR)
+        label = self.canvas.create_text(x + px / 2, y + px / 2, text=text, fill=color, font=("Segoe UI", max(px // 3, 6), "bold"))
+        self.drawn[(row, col)] = [rect, label, style]
+
+    # Source: Original work
+    def update_board(self, changed=None):
+        # Restyle the changed (row, col) cells that are on screen, or every drawn cell when changed is None
+        configured = 0
+        for key in (list(self.drawn) if changed is None else changed):
+            item = self.drawn.get(key)
+            if item is None:
+                continue  # Off screen, it will be drawn with its current state when it scrolls into view
+            style = self.cell_style(*key)
+            if style == item[2]:
+                continue
+            fill, text, color = style
+            self.canvas.itemconfig(item[0], fill=fill)
+            self.canvas.itemconfig(item[1], text=text, fill=color)
+            item[2] = style
+            configured += 1
+        if stats.enabled:
+            stats.count("widgets_configured", configured)
+        self.update_status()
@@ -13,8 +13,17 @@ Date Created: 8/29/2025
 
 Last Updated: 9/16/2025
 """
-from board_manager import BoardManager
+import math
+from collections import deque
 
+from board_manager import ADJACENT_SHIFT, COVERED_BIT, DIRTY_PAGE_SHIFT, FLAGGED_BIT, BoardManager, CompactBoardManager
+from instrumentation import stats
+
+# Source: Original work
+# Action codes for apply_actions (also the codes stored in move logs, see move_log.py)
+REVEAL = 0
+FLAG = 1
+CHORD = 2
 
 
 class GameLogic:
@@ -27,11 +36,11 @@ class GameLogic:
     """
 
     # Source: Original work combined with ChatGPT
-    def __init__(self, board_manager: BoardManager):
+    def __init__(self, board_manager: BoardManager, pool=None):
         """
         Initializes game logic for the board the player will interact with
 
-        Input: BoardManager class object from board_manager.py
+        Input: BoardManager class object from board_manager.py, optional BoardPool from board_pool.py that pre-generates boards
 
         Output: None
         
@@ -49,6 +58,12 @@ class GameLogic:
 
         self.first_click = True # Flag to indicate it is the first click
 
+        self.covered_safe = 0 # The number of non-mine cells that are still covered (victory once this hits 0)
+
+        self.pool = pool # When set, the first click takes a ready board from the pool instead of generating one
+
+        self.board_ready = False # Set when the board was already built for the coming first click (InputHandler's background no-guess search)
+
     # Source: Original work combined with ChatGPT
     def start_game(self, mine_count, safe_cell=None):
         """
@@ -67,6 +82,27 @@ class GameLogic:
         self.game_over = False
         self.victory = False
         self.first_click = True # ensure that first_click is set to True for resets
+        self.covered_safe = 0 # Set for real once the board is generated on the first click
+        self.board_ready = False
+
+        # Have a board ready in the background by the time the player clicks (no-guess boards never come from the pool)
+        if self.pool is not None and not self.board.no_guess:
+            self.pool.prefetch(self.board.size, mine_count)
+
+    # Source: Original work
+    def board_generated(self):
+        """
+        Called once the board has been generated (normally by the first click, or when a board is built some other way).
+
+        Input: None
+
+        Output: None
+        """
+        self.first_click = False
+        if self.board.size is None:
+            self.covered_safe = math.inf # Infinite board (infinite_board.py), there is always another safe cell to find
+        else:
+            self.covered_safe = self.board.size * self.board.size - self.board.count_mines() # Every safe cell starts covered
 
     # Source: Original work combined with ChatGPT
     def toggle_flag(self, row, col):
@@ -81,7 +117,8 @@ class GameLogic:
         
         """
 
-        if self.game_over:
+        # No flags once the game is over, or before the first click has generated the board
+        if self.game_over or self.first_click:
             return False
 
         cell = self.board.get_cell(row, col) # The cell that the player clicked on
@@ -105,71 +142,241 @@ class GameLogic:
             return False
 
     # Source: Original work combined with ChatGPT
-    def reveal_cell(self, row, col):
+    def reveal_cell(self, row, col, check=True):
         """
         Function called whenever the player reveals a cell (left click). Checks if the cell can be revealed, triggers game-over if the player uncovers a mine.
-            Automatically reveals any adjecant empty cells.
+            Automatically reveals any adjecant empty cells using an explicit queue, so large empty regions can't overflow the recursion limit.
 
-        Input: The x/y coordinates of the cell that the player clicks on 
+        Input: The x/y coordinates of the cell that the player clicks on, and whether to check for victory afterwards (apply_actions checks once per batch instead)
 
-        Output: None
+        Output: List of (row, col) tuples for every cell that was revealed by this click (empty if nothing changed)
         """
 
         # Once the player gets a game-over, they may no longer play.
         if self.game_over:
-            return
+            return []
         
         # If it is the first click, initialize the board and set first_click to False
         if self.first_click:
-            self.board.initialize_board(self.total_mines, safe_cell=(row, col))
-            self.first_click = False
+            # A pooled board can't be checked for no-guess play before the safe cell is known, so those are built here
+            use_pool = self.pool is not None and not self.board.no_guess
+            with stats.phase("generate"):
+                ready = self.pool.take(self.board.size, self.total_mines, (row, col)) if use_pool else None
+                if ready is not None:
+                    self.board = ready # Pre-generated board, already adapted to the safe cell
+                elif not self.board_ready:
+                    self.board.initialize_board(self.total_mines, safe_cell=(row, col))
+                self.board_ready = False
+            self.board_generated()
 
         cell = self.board.get_cell(row, col) # The cell that the player clicked on
 
         # A cell may not be revealed if: It has a flag on it, or if it has already been revealed.
         if cell.is_flagged or not cell.is_covered:
-            return
+            return []
         
         # Reveal the cell to the player
         cell.is_covered = False
+        revealed = [(row, col)]
 
         # If the revealed cell contains a mine, trigger a game-over state
         if cell.is_mine:
             self.game_over = True
             self.victory = False
-            return
+            return revealed
+
+        # If the revealed cell has no adjacent mines, flood fill outward through the connected empty cells.
+        if cell.adjacent == 0 and self.board.size is None:
+            self.flood_fill_unbounded(row, col, revealed)
+        elif cell.adjacent == 0 and isinstance(self.board, CompactBoardManager):
+            self.flood_fill_packed(row * self.board.size + col, revealed)
+        elif cell.adjacent == 0:
+            # No visited set: a cell is uncovered the first time it's reached, so is_covered already says whether it
+            # was seen, and the work stays proportional to the region instead of the board
+            size = self.board.size
+            queue = deque([(row, col)])
+            track = stats.enabled # Read once, the queue peak is only tracked while the instrumentation records
+            peak = 1 # Longest the queue got, reported to the instrumentation
+            while queue:
+                if track and len(queue) > peak:
+                    peak = len(queue)
+                r, c = queue.popleft()
+                # Check the 8 surrounding cells (nr = near rows, nc = near columns)
+                for nr in range(max(r-1, 0), min(r+2, size)):
+                    for nc in range(max(c-1, 0), min(c+2, size)):
+                        neighbor = self.board.get_cell(nr, nc)
+                        # Flagged and already revealed cells stop the cascade, same as a direct click would
+                        if neighbor.is_flagged or not neighbor.is_covered:
+                            continue
+                        neighbor.is_covered = False
+                        revealed.append((nr, nc))
+                        # Only empty cells keep spreading, numbered cells form the border of the region
+                        if neighbor.adjacent == 0:
+                            queue.append((nr, nc))
+            if track:
+                stats.peak("queue_peak", peak)
+
+        self.covered_safe -= len(revealed) # None of the revealed cells are mines at this point
+        if check:
+            self.check_victory() # Check for a victory state once the whole region has been revealed
+        return revealed
+
+    # Source: Original work
+    def chord(self, row, col, check=True):
+        """
+        Reveals every unflagged covered neighbor of a revealed number once the player has placed that many flags around it.
 
-        # If the revealed cell has no adjacent mines, recursively reveal all surrounding cells.
-        if cell.adjacent == 0:
-            # Check the 8 surrounding cells (nr = near rows, nc = near columns)
-            for nr in range(row-1, row+2):
-                for nc in range(col-1, col+2):
-                    #if the surrounding cells are within the bound of the board AND are not yet revealed, reveal them to the player.
-                    if 0 <= nr < self.board.size and 0 <= nc < self.board.size:
-                        if self.board.get_cell(nr, nc).is_covered:
-                            self.reveal_cell(nr, nc) # Recursive call of reveal_cell function
+        Input: The x/y coordinates of the numbered cell, and whether to check for victory afterwards
 
-        self.check_victory() # Check for a victory state after every time a cell is revealed
+        Output: List of (row, col) tuples for every cell that was revealed (empty if the number isn't satisfied)
+        """
+        if self.game_over or self.first_click:
+            return []
+        cell = self.board.get_cell(row, col)
+        adjacent = cell.adjacent
+        if cell.is_covered or adjacent == 0:
+            return []
+
+        size = self.board.size
+        if size is None:
+            neighbors = [(r, c) for r in (row-1, row, row+1) for c in (col-1, col, col+1)]
+        else:
+            neighbors = [(r, c) for r in range(max(row-1, 0), min(row+2, size)) for c in range(max(col-1, 0), min(col+2, size))]
+        if sum(1 for r, c in neighbors if self.board.get_cell(r, c).is_flagged) != adjacent:
+            return []
+
+        revealed = []
+        for r, c in neighbors:
+            # A wrong flag means one of these is a mine, stop there like a direct click would
+            revealed += self.reveal_cell(r, c, check=False)
+            if self.game_over:
+                break
+        if check:
+            self.check_victory()
+        return revealed
+
+    # Source: Original work
+    def apply_actions(self, actions, journal=None):
+        """
+        Applies a batch of player actions as one transaction: stops at the first action that ends the game, checks for
+            victory once at the end, and merges every changed cell into one list so the UI redraws once.
+
+        Input: Iterable of (action, row, col) with action REVEAL, FLAG or CHORD, and an optional list that gets an
+            (action, changed cells) entry for every action that changed something (used by history.py for undo)
+
+        Output: List of (row, col) tuples for every cell that changed, without duplicates
+        """
+        changed = {} # Used as an ordered set
+        revealed = 0 # Cells uncovered by reveals and chords, flag toggles are only in `changed`
+        for action, row, col in actions:
+            # The last reveal may have uncovered every safe cell, nothing after it can count
+            if self.game_over or (not self.first_click and self.covered_safe <= 0):
+                break
+            if action == REVEAL:
+                cells = self.reveal_cell(row, col, check=False)
+                revealed += len(cells)
+            elif action == FLAG:
+                cells = [(row, col)] if self.toggle_flag(row, col) else []
+            elif action == CHORD:
+                cells = self.chord(row, col, check=False)
+                revealed += len(cells)
+            else:
+                raise ValueError(f"Unknown action {action}")
+            if journal is not None and cells:
+                journal.append((action, cells))
+            changed.update(dict.fromkeys(cells))
+        if not self.first_click and not self.game_over:
+            with stats.phase("victory"):
+                self.check_victory()
+        if stats.enabled:
+            stats.count("cells_changed", len(changed))
+            stats.count("cells_revealed", revealed)
+        return list(changed)
+
+    # Source: Original work
+    def flood_fill_packed(self, start, revealed):
+        """
+        Same cascade as in reveal_cell for a CompactBoardManager, reading and writing the packed bytes directly instead
+            of going through a PackedCell per neighbor. The covered bit doubles as the visited mark.
+
+        Input: Flat index of the empty cell the cascade starts from (already revealed), and the list of revealed cells to extend
+
+        Output: None
+        """
+        board = self.board
+        size = board.size
+        cells = board.cells
+        first = len(revealed)
+        queue = deque([start])
+        track = stats.enabled
+        peak = 1
+        while queue:
+            if track and len(queue) > peak:
+                peak = len(queue)
+            r, c = divmod(queue.popleft(), size)
+            left, right = max(c-1, 0), min(c+2, size)
+            for nr in range(max(r-1, 0), min(r+2, size)):
+                base = nr * size
+                for i in range(base + left, base + right):
+                    value = cells[i]
+                    # Only covered, unflagged cells get revealed
+                    if value & (COVERED_BIT | FLAGGED_BIT) != COVERED_BIT:
+                        continue
+                    cells[i] = value & ~COVERED_BIT
+                    revealed.append((nr, i - base))
+                    if value >> ADJACENT_SHIFT == 0:
+                        queue.append(i)
+        if board.dirty_pages is not None:
+            board.dirty_pages.update({(r * size + c) >> DIRTY_PAGE_SHIFT for r, c in revealed[first:]})
+        if track:
+            stats.peak("queue_peak", peak)
+
+    # Source: Original work
+    def flood_fill_unbounded(self, row, col, revealed):
+        """
+        Same cascade as in reveal_cell, for boards without edges (size is None). The visited cells go in a set since
+            there is no fixed grid to index, and the board builds any chunk the cascade crosses into.
+
+        Input: The x/y coordinates of the empty cell the cascade starts from, and the list of revealed cells to extend
+
+        Output: None
+        """
+        visited = {(row, col)}
+        queue = deque([(row, col)])
+        track = stats.enabled
+        peak = 1
+        while queue:
+            if track and len(queue) > peak:
+                peak = len(queue)
+            r, c = queue.popleft()
+            for nr in (r-1, r, r+1):
+                for nc in (c-1, c, c+1):
+                    if (nr, nc) in visited:
+                        continue
+                    visited.add((nr, nc))
+                    neighbor = self.board.get_cell(nr, nc)
+                    if neighbor.is_flagged or not neighbor.is_covered:
+                        continue
+                    neighbor.is_covered = False
+                    revealed.append((nr, nc))
+                    if neighbor.adjacent == 0:
+                        queue.append((nr, nc))
+        if track:
+            stats.peak("queue_peak", peak)
 
     # Source: ChatGPT
     def check_victory(self):
         """
-        Helper function that checks for victory state.
+        Helper function that checks for victory state. Uses the running count of covered safe cells, so the check is constant time.
 
         Input: None
 
         Output: None
         """
 
-        # Check every cell on the board. If all of the cells without mines in them are revealed, trigger the victory state and the game is won.
-        for r in range(self.board.size):
-            for c in range(self.board.size):
-
-                cell = self.board.get_cell(r, c)
-
-                # If a cell which does not have a mine is still revealed, the player has not won the game.
-                if not cell.is_mine and cell.is_covered:
-                    return
+        # If any cell without a mine in it is still covered, the player has not won the game.
+        if self.covered_safe > 0:
+            return
         
         self.victory = True
         self.game_over = True
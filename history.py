@@ -0,0 +1,273 @@
+"""
+File Name: history.py
+
+Description: Undo/redo for GameLogic (practice mode, solver backtracking). Every move (one apply_actions batch) is
+journaled as the cells it changed plus the game counters before and after it, never as a copy of the board. A reveal
+only ever uncovers cells and a flag action only ever flips one flag, so the changed cells alone are enough to undo or
+redo a move exactly, and undoing a cascade that revealed 100k cells costs those 100k cells whatever the board size.
+
+Every `snapshot_interval` moves a packed snapshot of the whole board state is kept as well. seek() jumps to any move
+and picks whichever is cheaper: walking the journal from where the game is, or restoring the nearest snapshot and
+walking from there.
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- history.py -----
+from array import array
+
+from board_manager import COVERED_BIT, DIRTY_PAGE_SHIFT, FLAGGED_BIT, CompactBoardManager
+from game_logic import FLAG
+
+# Source: Original work
+SNAPSHOT_INTERVAL = 64  # Moves between two full snapshots, None for journals only
+
+# Class holding the journal of one move.
+# Source: Original work
+class Move:
+    __slots__ = ("segments", "before", "after", "cost")
+
+    def __init__(self, segments, before, after):
+        self.segments = segments  # [(flipped_flag, cells)] in the order they happened, cells as flat indices (or (row, col) on an infinite board)
+        self.before = before  # (flags, covered_safe, game_over, victory) before the move
+        self.after = after  # Same counters after the move
+        self.cost = sum(len(cells) for _, cells in segments)  # Cells touched to undo or redo it
+
+class GameHistory:
+    """
+    Undo/redo stack for one GameLogic.
+
+    Moves go through apply() instead of GameLogic.apply_actions. The first move of a new game (first_click is set)
+    starts a new history. Undoing the first move covers its cells again but keeps the generated board, so the
+    player retries the same board.
+    """
+
+    # Source: Original work
+    def __init__(self, game, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.game = game  # GameLogic being tracked
+        self.snapshot_interval = snapshot_interval
+        self.moves = []  # Move journal, oldest first
+        self.position = 0  # Moves currently applied, moves[position:] can be redone
+        self.snapshots = {}  # Move number -> packed board state after that many moves
+
+    # Source: Original work
+    def clear(self):
+        # Forget every move (new game)
+        self.moves = []
+        self.position = 0
+        self.snapshots = {}
+
+    @property
+    def can_undo(self):
+        return self.position > 0 and not self.game.first_click
+
+    @property
+    def can_redo(self):
+        return self.position < len(self.moves) and not self.game.first_click
+
+    # Source: Original work
+    def counters(self):
+        game = self.game
+        return game.flags, game.covered_safe, game.game_over, game.victory
+
+    # Source: Original work
+    def encode(self, cells):
+        # Store cells as flat indices in a compact array (8 bytes per cell instead of a tuple each)
+        size = self.game.board.size
+        if size is None:
+            return list(cells)
+        return array("q", [r * size + c for r, c in cells])
+
+    # Source: Original work
+    def decode(self, cells):
+        size = self.game.board.size
+        if size is None:
+            return cells
+        return [divmod(i, size) for i in cells]
+
+    # Source: Original work
+    def apply(self, actions):
+        """
+        Applies a batch of actions (see GameLogic.apply_actions) and journals it. Any moves that were undone can no
+        longer be redone afterwards.
+
+        Input: Iterable of (action, row, col)
+
+        Output: List of (row, col) tuples for every cell that changed
+        """
+        game = self.game
+        first = game.first_click
+        if first:
+            self.clear()
+        before = self.counters()
+        journal = []
+        changed = game.apply_actions(actions, journal)
+        if not journal:
+            return changed
+
+        segments = [(action == FLAG, self.encode(cells)) for action, cells in journal]
+        after = self.counters()
+        # covered_safe only changes through reveals, counting them back also gives the count before the board existed
+        board = game.board
+        revealed_safe = sum(1 for action, cells in journal if action != FLAG
+                            for r, c in cells if not board.get_cell(r, c).is_mine)
+        before = (0 if first else before[0], after[1] + revealed_safe, before[2], before[3])
+
+        del self.moves[self.position:]
+        for number in [n for n in self.snapshots if n > self.position]:
+            del self.snapshots[number]
+        self.moves.append(Move(segments, before, after))
+        self.position += 1
+        if self.snapshot_interval and self.position % self.snapshot_interval == 0 and board.size is not None:
+            self.snapshots[self.position] = self.snapshot()
+        return changed
+
+    # Source: Original work
+    def undo(self):
+        # Take back the last move, returns the cells that changed
+        if not self.can_undo:
+            return []
+        self.position -= 1
+        move = self.moves[self.position]
+        changed = []
+        for flipped, cells in reversed(move.segments):
+            changed += self.replay(flipped, cells, True)
+        self.set_counters(move.before)
+        return changed
+
+    # Source: Original work
+    def redo(self):
+        # Apply the next undone move again, returns the cells that changed
+        if not self.can_redo:
+            return []
+        move = self.moves[self.position]
+        self.position += 1
+        changed = []
+        for flipped, cells in move.segments:
+            changed += self.replay(flipped, cells, False)
+        self.set_counters(move.after)
+        return changed
+
+    # Source: Original work
+    def replay(self, flipped, cells, covered):
+        """
+        Applies one journal segment: flips the flags of a flag segment, or covers (undo) or uncovers (redo) the cells
+        of a reveal segment. On a CompactBoardManager the bits are set on the packed array directly, without a
+        PackedCell per cell.
+
+        Input: Segment (flipped flag, cells) and whether the move is being undone
+
+        Output: List of (row, col) tuples of the segment
+        """
+        board = self.game.board
+        if isinstance(board, CompactBoardManager):
+            packed = board.cells
+            if flipped:
+                for i in cells:
+                    packed[i] ^= FLAGGED_BIT
+            elif covered:
+                for i in cells:
+                    packed[i] |= COVERED_BIT
+            else:
+                for i in cells:
+                    packed[i] &= ~COVERED_BIT
+            if board.dirty_pages is not None:
+                board.dirty_pages.update({i >> DIRTY_PAGE_SHIFT for i in cells})
+            return self.decode(cells)
+        cells = self.decode(cells)
+        for r, c in cells:
+            cell = board.get_cell(r, c)
+            if flipped:
+                cell.is_flagged = not cell.is_flagged
+            else:
+                cell.is_covered = covered
+        return cells
+
+    # Source: Original work
+    def set_counters(self, counters):
+        game = self.game
+        game.flags, game.covered_safe, game.game_over, game.victory = counters
+
+    # Source: Original work
+    def snapshot(self):
+        """
+        Packed copy of the covered/flagged state of every cell plus the counters. On a CompactBoardManager this is one
+        bytes copy of the cell array, other boards are packed one byte per cell.
+
+        Input: None
+
+        Output: (packed bytes, counters)
+        """
+        board = self.game.board
+        if isinstance(board, CompactBoardManager):
+            return bytes(board.cells), self.counters()
+        size = board.size
+        packed = bytearray(size * size)
+        for r in range(size):
+            for c in range(size):
+                cell = board.get_cell(r, c)
+                packed[r * size + c] = COVERED_BIT * cell.is_covered | FLAGGED_BIT * cell.is_flagged
+        return bytes(packed), self.counters()
+
+    # Source: Original work
+    def restore(self, snapshot):
+        # Put the board back into a snapshot's state
+        packed, counters = snapshot
+        board = self.game.board
+        if isinstance(board, CompactBoardManager):
+            board.cells[:] = packed
+            if board.dirty_pages is not None:
+                board.dirty_pages.update(range((len(packed) >> DIRTY_PAGE_SHIFT) + 1))
+        else:
+            size = board.size
+            for r in range(size):
+                for c in range(size):
+                    cell = board.get_cell(r, c)
+                    state = packed[r * size + c]
+                    cell.is_covered = bool(state & COVERED_BIT)
+                    cell.is_flagged = bool(state & FLAGGED_BIT)
+        self.set_counters(counters)
+
+    # Source: Original work
+    def seek(self, target):
+        """
+        Puts the game in the state after `target` moves, walking the journal or restoring a snapshot, whichever touches
+        fewer cells.
+
+        Input: Move number, 0 to len(moves)
+
+        Output: List of (row, col) tuples that may have changed, or None if a snapshot was restored (redraw everything)
+        """
+        target = max(0, min(target, len(self.moves)))
+        if target == self.position or self.game.first_click:
+            return []
+        low, high = sorted((self.position, target))
+        walk = sum(move.cost for move in self.moves[low:high])
+        size = self.game.board.size
+        best = None
+        if size is not None:
+            for number in self.snapshots:
+                # A snapshot costs a pass over the board, plus the journal from it to the target
+                start, end = sorted((number, target))
+                cost = size * size + sum(move.cost for move in self.moves[start:end])
+                if cost < walk and (best is None or cost < best[1]):
+                    best = (number, cost)
+        if best is not None:
+            self.restore(self.snapshots[best[0]])
+            self.position = best[0]
+            while self.position < target:
+                self.redo()
+            while self.position > target:
+                self.undo()
+            return None
+        changed = []
+        while self.position < target:
+            changed += self.redo()
+        while self.position > target:
+            changed += self.undo()
+        return changed
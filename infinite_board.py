@@ -0,0 +1,164 @@
+"""
+File Name: infinite_board.py
+
+Description: "Infinite" board mode. The plane is split into square chunks kept in a dict keyed by chunk coordinates,
+and a chunk is only built the first time one of its cells is touched. Mines are placed deterministically from
+(seed, chunk row, chunk col), so any chunk can be rebuilt at any time, and the border adjacency counts come from the
+mine layouts of the 8 neighboring chunks (which are sampled, not built). Chunks the player never changed are kept in a
+least-recently-used cache and dropped when it fills up; changed chunks are kept for good. Memory therefore depends on
+the area explored, not on the extent of the board.
+
+Cells use the same one-byte layout as CompactBoardManager. Rows and columns can be any integers, negative included.
+The board has no size (size is None), so a game on it never runs out of covered cells: start it with
+game.start_game(math.inf) to lift the flag limit, and it only ends by hitting a mine.
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- infinite_board.py -----
+import random
+from collections import OrderedDict
+
+from board_manager import ADJACENT_SHIFT, COVERED_BIT, FLAG_MASK, FLAGGED_BIT, MINE_BIT, BoardManager, PackedCell, sample_mine_indices
+
+# Source: Original work
+CHUNK_SIZE = 32  # Rows and columns per chunk
+DENSITY = 0.15  # Fraction of the cells of every chunk that are mines (about the same as 10x10 with 15 mines)
+CACHE_CHUNKS = 256  # Unchanged chunks kept before the least recently used ones are dropped
+# Below this density the empty cells link up into one endless region and the first cascade would never stop
+# ((1 - density)^9, the chance a cell is empty, has to stay well under the ~0.41 percolation threshold of the grid)
+MIN_DENSITY = 0.12
+
+# Source: Original work
+# bytes.translate deletion table: deleting every byte of a cell that is still covered and unflagged leaves nothing
+# behind for a chunk the player never changed
+UNTOUCHED = bytes(b for b in range(256) if b & (COVERED_BIT | FLAGGED_BIT) == COVERED_BIT)
+
+# Board made of lazily built chunks with no edges.
+# Source: Original work
+class ChunkedBoardManager(BoardManager):
+    def __init__(self, size=None, seed=None, rng=None, safe_neighborhood=True, no_guess=False,
+                 chunk_size=CHUNK_SIZE, density=DENSITY, cache_chunks=CACHE_CHUNKS):
+        super().__init__(None, seed, rng, safe_neighborhood) # size is accepted so the board fits the other managers' signature, but ignored
+        if no_guess:
+            raise ValueError("No-guess generation needs a finite board")
+        if not MIN_DENSITY <= density < 1:
+            raise ValueError(f"Mine density must be between {MIN_DENSITY} and 1 on an infinite board")
+        self.chunk_size = chunk_size
+        self.density = density
+        self.cache_chunks = cache_chunks
+        self.safe_zone = frozenset() # Cells around the first click that never get a mine
+        self.kept = {} # (chunk row, chunk col) -> bytearray, chunks the player changed
+        self.cache = OrderedDict() # Chunks that were unchanged when last checked, least recently used first
+        self.layouts = OrderedDict() # (chunk row, chunk col) -> mine indices, shared by a chunk and its neighbors
+        self.chunks_built = 0 # Chunks built so far, rebuilds of dropped chunks included
+
+    def initialize_board(self, mine_count=0, safe_cell=None, seed=None):
+        # Start a new board; the mine count is ignored, every chunk gets `density` of its cells as mines
+        self.seed = seed if seed is not None else self.rng.randrange(2**63)
+        self.relocate_mines(safe_cell)
+
+    def relocate_mines(self, safe_cell, rng=None):
+        # Keep the first click (and its neighbors) mine-free. Nothing is built yet, so dropping the chunks is all it takes.
+        if safe_cell is None:
+            self.safe_zone = frozenset()
+        else:
+            row, col = safe_cell
+            spread = 1 if self.safe_neighborhood else 0
+            self.safe_zone = frozenset((r, c) for r in range(row - spread, row + spread + 1)
+                                       for c in range(col - spread, col + spread + 1))
+        self.kept.clear()
+        self.cache.clear()
+        self.layouts.clear()
+        return []
+
+    def chunk_mines(self, chunk):
+        # Flat indices of the mines in a chunk, the same for the same seed every time
+        layout = self.layouts.get(chunk)
+        if layout is not None:
+            self.layouts.move_to_end(chunk)
+            return layout
+        cs = self.chunk_size
+        top, left = chunk[0] * cs, chunk[1] * cs
+        excluded = [(r - top) * cs + c - left for r, c in self.safe_zone if top <= r < top + cs and left <= c < left + cs]
+        count = min(round(cs * cs * self.density), cs * cs - len(excluded))
+        layout = sample_mine_indices(cs * cs, count, random.Random(f"{self.seed}:{chunk[0]}:{chunk[1]}"), excluded)
+        self.layouts[chunk] = layout
+        while len(self.layouts) > self.cache_chunks * 2:
+            self.layouts.popitem(last=False)
+        return layout
+
+    def build_chunk(self, chunk):
+        """
+        Builds the packed cells of one chunk: its own mines plus adjacency counts that include the mines just across its
+        borders in the 8 neighboring chunks.
+
+        Input: (chunk row, chunk col)
+
+        Output: bytearray of chunk_size * chunk_size packed cells
+        """
+        cs = self.chunk_size
+        cells = bytearray([COVERED_BIT]) * (cs * cs)
+        own = self.chunk_mines(chunk)
+        for i in own:
+            cells[i] |= MINE_BIT
+        step = 1 << ADJACENT_SHIFT
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                for i in own if dr == dc == 0 else self.chunk_mines((chunk[0] + dr, chunk[1] + dc)):
+                    # Mine position relative to this chunk's top-left cell
+                    r, c = divmod(i, cs)
+                    r += dr * cs
+                    c += dc * cs
+                    if r < -1 or r > cs or c < -1 or c > cs:
+                        continue # Too far from the border to touch this chunk
+                    for nr in range(max(r-1, 0), min(r+2, cs)):
+                        base = nr * cs
+                        for nc in range(max(c-1, 0), min(c+2, cs)):
+                            cells[base + nc] += step
+        # Mine cells keep an adjacent count of 0, same as the other boards
+        for i in own:
+            cells[i] &= FLAG_MASK
+        self.chunks_built += 1
+        return cells
+
+    def load_chunk(self, chunk):
+        # Cached chunk, or a freshly built one; makes room in the cache by dropping unchanged chunks
+        cells = self.cache.get(chunk)
+        if cells is not None:
+            self.cache.move_to_end(chunk)
+            return cells
+        cells = self.build_chunk(chunk)
+        self.cache[chunk] = cells
+        while len(self.cache) > self.cache_chunks:
+            old, old_cells = self.cache.popitem(last=False)
+            if old_cells.translate(None, UNTOUCHED):
+                self.kept[old] = old_cells # Changed since it was built, it can't be rebuilt from the seed anymore
+        return cells
+
+    @property
+    def loaded_chunks(self):
+        # Chunks currently in memory
+        return len(self.kept) + len(self.cache)
+
+    def get_cell(self, row, col):
+        # Return a proxy for the packed byte of any cell of the plane. Only valid until the next get_cell call, which may drop its chunk.
+        cs = self.chunk_size
+        chunk = (row // cs, col // cs)
+        cells = self.kept.get(chunk)
+        if cells is None:
+            cells = self.load_chunk(chunk)
+        return PackedCell(cells, (row % cs) * cs + col % cs)
+
+    def calculate_adjacent_counts(self):
+        # Counts are worked out per chunk as chunks get built
+        pass
+
+    def reset_board(self):
+        super().reset_board()
+        self.relocate_mines(None)
@@ -2,8 +2,13 @@
 """
 File Name: input_handler.py
 
-Description: Handles user input events for the Minesweeper game. 
-    Includes --> 1) Processing left clicks (reveal cells), 2) Processing right clicks (toggle flags), and 3) Coordinating between game logic and UI updates
+Description: Handles user input events for the Minesweeper game.
+    Includes --> 1) Processing left clicks (reveal cells), 2) Processing right clicks (toggle flags), 3) Processing double clicks (chord),
+    4) Coordinating between game logic and UI updates, 5) Recording every move to an optional MoveRecorder (move_log.py),
+    6) Undo/redo through an optional GameHistory (history.py), and 7) Timing every game and saving the finished ones to an
+    optional StatsStore (stats_store.py)
+    Inputs that arrive within one Tk idle cycle are applied as a single batch (GameLogic.apply_actions) with a single redraw.
+    In the Tk window a no-guess board is searched for in a background thread, clicks made meanwhile wait for it.
 
 All Collaborators: Group 4, ChatGPT
 
@@ -13,43 +18,160 @@ Date Created: 8/29/2025
 
 Last Updated: 9/16/2025
 """
+import threading
+import time
+
+from game_logic import CHORD, FLAG, REVEAL
+from instrumentation import stats
+
+# Source: Original work
+GENERATION_POLL_MS = 20  # How often Tk checks whether a background no-guess search is done
 
 class InputHandler:
     """
-    Class that handles user input events for the Minesweeper game. 
-    Includes --> 1) Processing left clicks (reveal cells), 2) Processing right clicks (toggle flags), and 3) Coordinating between game logic and UI updates
+    Class that handles user input events for the Minesweeper game.
+    Includes --> 1) Processing left clicks (reveal cells), 2) Processing right clicks (toggle flags), 3) Processing double clicks (chord),
+    and 4) Coordinating between game logic and UI updates
     """
 
     # Source: ChatGPT
-    def __init__(self, game_logic, ui):
+    def __init__(self, game_logic, ui, recorder=None, history=None, store=None):
         # Store reference to the game logic instance for making game state changes
         self.game = game_logic
         # Store reference to the user interface instance for updating the display
         self.ui = ui
+        # Optional MoveRecorder that logs every move of the game
+        self.recorder = recorder
+        # Optional GameHistory for undo/redo, left out when recording (a move log can't take moves back)
+        self.history = history
+        # Optional StatsStore that keeps every finished game for the stats and leaderboard
+        self.store = store
+        # Current game: when the first click came in, actions so far, and whether an undo/redo was used (practice
+        # games are not saved to the stats)
+        self.started = 0.0
+        self.clicks = 0
+        self.practice = False
+        # Seconds the last finished game took, for the game-over message
+        self.duration = 0.0
+        # Actions queued since the last flush, applied together on the next idle cycle
+        self.pending = []
+        # Thread building a no-guess board for the first click, None when no search is running
+        self.generating = None
 
     # Source: ChatGPT
     def handle_left_click(self, row, col):
-        # Tell the game logic to reveal the clicked cell
-        self.game.reveal_cell(row, col)
-        # Update the visual board display's new state
-        self.ui.update_board()
+        # Reveal the clicked cell
+        self.queue(REVEAL, row, col)
+
+    # Source: Original work combined with ChatGPT
+    def handle_right_click(self, row, col):
+        # Place or remove a flag, GameLogic ignores revealed cells
+        self.queue(FLAG, row, col)
+
+    # Source: Original work
+    def handle_chord(self, row, col):
+        # Reveal the neighbors of a satisfied number (double click)
+        self.queue(CHORD, row, col)
+
+    # Source: Original work
+    def handle_undo(self, event=None):
+        # Take back the last move (Ctrl+Z)
+        self.step(lambda history: history.undo())
+
+    # Source: Original work
+    def handle_redo(self, event=None):
+        # Apply the last undone move again (Ctrl+Y)
+        self.step(lambda history: history.redo())
+
+    # Source: Original work
+    def step(self, move):
+        # Run an undo or redo after any queued clicks, and redraw the cells it changed
+        if self.history is None:
+            return
+        if self.pending:
+            self.flush()
+        changed = move(self.history)
+        if changed:
+            self.practice = True
+            self.ui.update_board(changed)
+
+    # Source: Original work
+    def queue(self, action, row, col):
+        # Hold the action until Tk is idle, so a burst of events becomes one batch and one redraw
+        if not self.pending:
+            self.ui.root.after_idle(self.flush)
+        self.pending.append((action, row, col))
+
+    # Source: Original work combined with ChatGPT
+    def flush(self):
+        # Apply every queued action as one transaction and redraw the cells that changed
+        if self.generating is not None:
+            return # The board is still being searched for, finish_generating flushes the queue once it is ready
+        actions, self.pending = self.pending, []
+        if not actions or self.game.game_over:
+            return # Nothing queued (an undo already flushed it), or the game ended earlier in the batch
+        if self.game.first_click and self.game.board.no_guess and not self.game.board_ready and hasattr(self.ui.root, "after"):
+            first = next(((row, col) for action, row, col in actions if action == REVEAL), None)
+            if first is not None:
+                self.pending = actions
+                self.start_generating(first)
+                return
+        if self.game.first_click:
+            # The game clock starts with the first click
+            self.started = time.monotonic()
+            self.clicks = 0
+            self.practice = False
+        self.clicks += len(actions)
+        if self.recorder is not None:
+            recorded = actions
+            # The first click of a game starts a new log. Anything before it does nothing (there is no board yet),
+            # while a replay starts with the board in place, so those actions are left out.
+            if self.game.first_click:
+                self.recorder.reset()
+                first = next((i for i, (action, _, _) in enumerate(actions) if action == REVEAL), len(actions))
+                recorded = actions[first:]
+            for action, row, col in recorded:
+                self.recorder.record(action, row, col)
+        stats.begin_event(len(actions))
+        with stats.phase("logic"):
+            if self.history is not None:
+                changed = self.history.apply(actions)
+            else:
+                changed = self.game.apply_actions(actions)
+        # Redraw only the cells that changed
+        if changed:
+            with stats.phase("render"):
+                self.ui.update_board(changed)
+        stats.end_event() # Before the game-over dialog, which waits for the player
         # Check for victory or loss condition
         if self.game.game_over:
+            self.duration = time.monotonic() - self.started
+            if self.recorder is not None:
+                self.recorder.finish()
+            if self.store is not None and not self.practice and self.game.board.size is not None:
+                # Queued for the store's writer thread, nothing here waits on the disk
+                board = self.game.board
+                self.store.record(board.size, self.game.total_mines, board.seed, self.duration, self.clicks, self.game.victory)
 
             # Pass victory status (true/false)
             self.ui.show_game_over(self.game.victory)
 
-    # Source: Original work combined with ChatGPT
-    def handle_right_click(self, row, col):
-        # Don't try to flag an uncovered cell or if the game is over
-        if self.game.game_over:
-            return
-        cell = self.game.board.get_cell(row, col) # get the cell that was clicked
-        # Ignore attempts to flag uncovered cells
-        if not cell.is_covered:
-            return
+    # Source: Original work
+    def start_generating(self, safe_cell):
+        # Search for the no-guess board in a background thread, so the window keeps responding (the search is bounded
+        # by no_guess.TIME_BUDGET, but a second is still a long freeze)
+        self.generating = threading.Thread(target=self.game.board.initialize_board, args=(self.game.total_mines, safe_cell),
+                                           name="no-guess-search", daemon=True)
+        self.generating.start()
+        self.ui.root.after(GENERATION_POLL_MS, self.finish_generating)
 
-        changed = self.game.toggle_flag(row, col) # toggle the flag and store if it was toggled
-        # if the flag was toggled, update the board
-        if changed:
-            self.ui.update_board()
\ No newline at end of file
+    # Source: Original work
+    def finish_generating(self):
+        # Poll the search from the Tk loop, then play the queued clicks on the new board (the game clock starts here,
+        # the player can't do anything before the board exists)
+        if self.generating.is_alive():
+            self.ui.root.after(GENERATION_POLL_MS, self.finish_generating)
+            return
+        self.generating = None
+        self.game.board_ready = True
+        self.flush()
@@ -0,0 +1,283 @@
+"""
+File Name: instrumentation.py
+
+Description: Lightweight instrumentation of the input -> game logic -> UI path. Every input event (one batch of
+clicks, see InputHandler.flush) gets per-phase timings (game logic, board generation, victory check, rendering) and
+counters (cells revealed, cells changed including flag toggles, widgets reconfigured, peak flood fill queue length).
+The numbers are available in process through `stats` (last events plus running totals) and on screen through
+DebugOverlay. An opt-in cProfile capture can
+run around the whole session.
+
+Everything is off by default and the hooks then cost a flag check per input event, nothing per cell.
+
+    MINESWEEPER_STATS=1         record timings and counters from the start
+    MINESWEEPER_PROFILE=file    profile the whole session with cProfile and write the stats to `file` on exit
+    F12 (in the game window)    show/hide the debug overlay (showing it turns recording on)
+    F10 (in the game window)    start/stop a cProfile capture, written to minesweeper.prof
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- instrumentation.py -----
+import atexit
+import io
+import os
+import time
+from collections import deque
+
+# Source: Original work
+EVENT_HISTORY = 200  # Input events kept for the stats API and the overlay
+PROFILE_FILE = "minesweeper.prof"  # Where the F10 capture is written
+OVERLAY_REFRESH_MS = 500  # How often the overlay redraws while it is shown
+
+# Context manager that does nothing, handed out by phase() while recording is off.
+# Source: Original work
+class NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_PHASE = NullPhase()
+
+# Times one phase of the current input event.
+# Source: Original work
+class Phase:
+    __slots__ = ("stats", "name", "started")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add_time(self.name, time.perf_counter() - self.started)
+        return False
+
+class Instrumentation:
+    """
+    Per-event phase timings and counters.
+
+    Call sites wrap their work in `with stats.phase(name):` and report counts with `stats.count(name, n)` behind an
+    `if stats.enabled:` check. Phases may nest (board generation happens inside the game logic phase), each phase
+    records its own inclusive time.
+    """
+
+    # Source: Original work
+    def __init__(self, enabled=False):
+        self.enabled = enabled  # Recording on/off, checked by every hook
+        self.events = deque(maxlen=EVENT_HISTORY)  # Finished events, newest last
+        self.totals = {}  # Phase name -> [calls, total seconds, slowest]
+        self.counters = {}  # Counter name -> running total
+        self.current = None  # Event being recorded: {"actions", "phases", "counters", "started"}
+        self.profiler = None  # Running cProfile.Profile, if a capture is active
+
+    # Source: Original work
+    def phase(self, name):
+        # Context manager that times `name` for the current event
+        return Phase(self, name) if self.enabled else NULL_PHASE
+
+    # Source: Original work
+    def begin_event(self, actions):
+        # Start recording one input event of `actions` queued actions
+        if self.enabled:
+            self.current = {"actions": actions, "phases": {}, "counters": {}, "started": time.perf_counter()}
+
+    # Source: Original work
+    def end_event(self):
+        # Finish the current event and keep it in the history
+        event, self.current = self.current, None
+        if event is None:
+            return
+        event["total"] = time.perf_counter() - event.pop("started")
+        self.events.append(event)
+        self.add_total("event", event["total"])
+
+    # Source: Original work
+    def add_time(self, name, seconds):
+        # Charge time to a phase of the current event and to the running totals
+        if self.current is not None:
+            phases = self.current["phases"]
+            phases[name] = phases.get(name, 0.0) + seconds
+        self.add_total(name, seconds)
+
+    # Source: Original work
+    def add_total(self, name, seconds):
+        total = self.totals.get(name)
+        if total is None:
+            self.totals[name] = [1, seconds, seconds]
+        else:
+            total[0] += 1
+            total[1] += seconds
+            total[2] = max(total[2], seconds)
+
+    # Source: Original work
+    def count(self, name, amount=1):
+        # Add to a counter of the current event and to its running total
+        if self.current is not None:
+            counters = self.current["counters"]
+            counters[name] = counters.get(name, 0) + amount
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    # Source: Original work
+    def peak(self, name, value):
+        # Keep the largest value seen for a gauge (like the flood fill queue length)
+        if self.current is not None:
+            counters = self.current["counters"]
+            counters[name] = max(counters.get(name, 0), value)
+        self.counters[name] = max(self.counters.get(name, 0), value)
+
+    # Source: Original work
+    def snapshot(self):
+        """
+        In-process stats API.
+
+        Input: None
+
+        Output: Dict with "enabled", "last_event", "phases" (name -> calls, total/mean/max milliseconds), "counters" and "profiling"
+        """
+        phases = {name: {"calls": calls, "total_ms": total * 1e3, "mean_ms": total / calls * 1e3, "max_ms": slowest * 1e3}
+                  for name, (calls, total, slowest) in self.totals.items()}
+        return {
+            "enabled": self.enabled,
+            "last_event": self.events[-1] if self.events else None,
+            "phases": phases,
+            "counters": dict(self.counters),
+            "profiling": self.profiler is not None,
+        }
+
+    # Source: Original work
+    def reset(self):
+        # Forget every recorded event, total and counter
+        self.events.clear()
+        self.totals.clear()
+        self.counters.clear()
+        self.current = None
+
+    # Source: Original work
+    def start_profile(self):
+        # Start a cProfile capture (no-op if one is running)
+        if self.profiler is None:
+            import cProfile # Only loaded for a capture, it would add to every start-up
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    # Source: Original work
+    def stop_profile(self, path=PROFILE_FILE):
+        """
+        Stops the cProfile capture and writes it out (load with pstats or snakeviz).
+
+        Input: File to write the profile to
+
+        Output: Text of the 20 most expensive functions by cumulative time, or None if no capture was running
+        """
+        if self.profiler is None:
+            return None
+        import pstats
+        profiler, self.profiler = self.profiler, None
+        profiler.disable()
+        profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(20)
+        return out.getvalue()
+
+    # Source: Original work
+    def toggle_profile(self, path=PROFILE_FILE):
+        # Start a capture, or stop the running one and print its summary
+        if self.profiler is None:
+            self.start_profile()
+            print("Profiling started (F10 again to stop)")
+        else:
+            print(self.stop_profile(path))
+            print(f"Profile written to {path}")
+
+# Source: Original work
+# The instance every hook reports to
+stats = Instrumentation(enabled=os.environ.get("MINESWEEPER_STATS", "") not in ("", "0"))
+
+# Source: Original work
+def profile_from_environment():
+    # Start a whole-session capture if MINESWEEPER_PROFILE names an output file
+    path = os.environ.get("MINESWEEPER_PROFILE")
+    if path:
+        stats.start_profile()
+        atexit.register(stats.stop_profile, path)
+
+class DebugOverlay:
+    """
+    Small always-on-top window with the timings of the last input event, the running per-phase totals and the counters.
+    Showing it turns recording on, hiding it restores the previous setting.
+    """
+
+    # Source: Original work
+    def __init__(self, root):
+        self.root = root  # Game window
+        self.window = None  # Toplevel while the overlay is shown
+        self.label = None
+        self.was_enabled = stats.enabled  # Recording state to go back to when the overlay is hidden
+
+    # Source: Original work
+    def toggle(self, event=None):
+        # Show or hide the overlay (bound to F12)
+        if self.window is None:
+            self.show()
+        else:
+            self.hide()
+
+    # Source: Original work
+    def show(self):
+        import tkinter as tk # Only the GUI needs Tk, the stats API works headless
+        self.was_enabled = stats.enabled
+        stats.enabled = True
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Debug")
+        self.window.attributes("-topmost", True)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        self.label = tk.Label(self.window, justify=tk.LEFT, anchor="nw", font=("Courier", 9))
+        self.label.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
+        self.refresh()
+
+    # Source: Original work
+    def hide(self):
+        stats.enabled = self.was_enabled
+        if self.window is not None:
+            self.window.destroy()
+        self.window = None
+        self.label = None
+
+    # Source: Original work
+    def refresh(self):
+        # Redraw the text, then again in OVERLAY_REFRESH_MS while the overlay is shown
+        if self.window is None:
+            return
+        self.label.config(text=self.text())
+        self.window.after(OVERLAY_REFRESH_MS, self.refresh)
+
+    # Source: Original work
+    def text(self):
+        # Overlay contents
+        snapshot = stats.snapshot()
+        lines = []
+        event = snapshot["last_event"]
+        if event is not None:
+            lines.append(f"Last event: {event['actions']} action(s), {event['total'] * 1e3:.2f} ms")
+            lines += [f"  {name:<18}{seconds * 1e3:9.2f} ms" for name, seconds in event["phases"].items()]
+            lines += [f"  {name:<18}{value:9}" for name, value in event["counters"].items()]
+        lines.append("Totals:              calls   mean ms    max ms")
+        lines += [f"  {name:<18}{p['calls']:7}{p['mean_ms']:10.2f}{p['max_ms']:10.2f}" for name, p in snapshot["phases"].items()]
+        lines += [f"  {name:<18}{value:9}" for name, value in snapshot["counters"].items()]
+        if snapshot["profiling"]:
+            lines.append("cProfile capture running (F10 to stop)")
+        return "\n".join(lines)
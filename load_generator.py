@@ -0,0 +1,123 @@
+"""
+File Name: load_generator.py
+
+Description: Load generator for server.py. Opens a number of concurrent connections, and on each one plays games back
+to back the way a simple bot would: start a session, reveal random covered cells (tracked from the changed cells in
+the replies) until the game ends, close the session, start the next. Every request is timed, and at the end it reports
+requests/sec, games played and the latency percentiles (p50, p90, p99, max).
+
+Run with: python server.py &
+          python load_generator.py --connections 100 --duration 10
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- load_generator.py -----
+import argparse
+import asyncio
+import json
+import random
+import time
+
+# Source: Original work
+def percentile(sorted_values, fraction):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+# Class holding the totals of a load run.
+# Source: Original work
+class LoadStats:
+    def __init__(self):
+        self.latencies = []  # Seconds per request, every request of every connection
+        self.games = 0  # Games played to the end
+        self.wins = 0
+        self.errors = 0  # Replies with an "error" field
+        self.elapsed = 0.0  # Wall clock seconds of the run
+
+    def report(self):
+        latencies = sorted(self.latencies)
+        rps = len(latencies) / self.elapsed if self.elapsed else 0.0
+        ms = lambda fraction: percentile(latencies, fraction) * 1e3
+        return (f"{len(latencies)} requests in {self.elapsed:.1f}s | {rps:,.0f} req/s | {self.games} games ({self.wins} won) | "
+                f"{self.errors} errors | latency p50 {ms(0.50):.2f} ms, p90 {ms(0.90):.2f} ms, p99 {ms(0.99):.2f} ms, "
+                f"max {(latencies[-1] if latencies else 0) * 1e3:.2f} ms")
+
+# Source: Original work
+async def request(reader, writer, stats, message):
+    # Send one request and wait for its reply, timing the round trip
+    started = time.perf_counter()
+    writer.write(json.dumps(message).encode() + b"\n")
+    reply = json.loads(await reader.readline())
+    stats.latencies.append(time.perf_counter() - started)
+    if "error" in reply:
+        stats.errors += 1
+    return reply
+
+# Source: Original work
+async def play(host, port, size, mines, deadline, stats, seed):
+    """
+    One connection playing random games until the deadline.
+
+    Input: Server address, board size, mines per game, time.monotonic() deadline, shared LoadStats and a seed for the clicks
+
+    Output: None
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.monotonic() < deadline:
+            session = (await request(reader, writer, stats, {"op": "new", "size": size, "mines": mines}))["session"]
+            covered = list(range(size * size))
+            rng.shuffle(covered)
+            revealed = set()
+            state = "playing"
+            while state == "playing" and time.monotonic() < deadline:
+                # Next random cell that earlier cascades didn't already reveal
+                while covered[-1] in revealed:
+                    covered.pop()
+                row, col = divmod(covered.pop(), size)
+                reply = await request(reader, writer, stats, {"op": "reveal", "session": session, "row": row, "col": col})
+                if "error" in reply:
+                    break
+                revealed.update(r * size + c for r, c, _ in reply["changed"])
+                state = reply["state"]
+            if state != "playing":
+                stats.games += 1
+                stats.wins += state == "won"
+            await request(reader, writer, stats, {"op": "close", "session": session})
+    finally:
+        writer.close()
+
+# Source: Original work
+async def run(host, port, connections, duration, size, mines, seed=0):
+    # Run every connection at once and collect the totals
+    stats = LoadStats()
+    started = time.monotonic()
+    deadline = started + duration
+    await asyncio.gather(*(play(host, port, size, mines, deadline, stats, seed * connections + i) for i in range(connections)))
+    stats.elapsed = time.monotonic() - started
+    return stats
+
+# Source: Original work
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for the Minesweeper game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--connections", type=int, default=50, help="concurrent connections, each playing its own games")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--size", type=int, default=16, help="board size of every game")
+    parser.add_argument("--mines", type=int, default=40, help="mines per game")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random clicks")
+    args = parser.parse_args(argv)
+    stats = asyncio.run(run(args.host, args.port, args.connections, args.duration, args.size, args.mines, args.seed))
+    print(stats.report())
+
+if __name__ == "__main__":
+    main()
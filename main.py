@@ -13,31 +13,95 @@ Date Created: 8/29/2025
 
 Last Updated: 9/14/2025
 """
-import tkinter as tk
+import argparse
+import math
 from board_manager import BoardManager
+from board_pool import BoardPool
 from game_logic import GameLogic
+from history import GameHistory
 from input_handler import InputHandler
-from user_interface import UserInterface
+from instrumentation import profile_from_environment
+from move_log import MoveRecorder
+from stats_store import DEFAULT_PATH, StatsStore
+# tkinter and the Tk frontends are imported in main() only when the GUI is used, so --tui never loads them
+
+# Source: Original work
+def parse_args(argv=None):
+    # Command line options for the board size and which renderer to use
+    parser = argparse.ArgumentParser(description="Minesweeper")
+    parser.add_argument("--size", type=int, default=10, help="number of rows and columns on the board (default: 10)")
+    parser.add_argument("--canvas", action="store_true", help="draw the board on a single canvas (recommended for large boards)")
+    parser.add_argument("--no-guess", action="store_true", help="only deal boards that can be solved from the first click without guessing")
+    parser.add_argument("--record", metavar="DIR", default=None, help="save a move log of every finished game to DIR (replay with move_log.py)")
+    parser.add_argument("--stats", metavar="DB", default=DEFAULT_PATH, help="database that keeps finished games for the stats (F9) and best times (default: ~/.minesweeper_stats.db)")
+    parser.add_argument("--no-stats", action="store_true", help="don't keep finished games")
+    parser.add_argument("--tui", action="store_true", help="play in the terminal (curses) instead of a window")
+    parser.add_argument("--mines", type=int, default=None, help="mines per game in the terminal frontend (default: about 15%% of the cells)")
+    parser.add_argument("--infinite", action="store_true", help="play on an endless board in the terminal (implies --tui, see infinite_board.py)")
+    parser.add_argument("--first-frame-exit", action="store_true", help=argparse.SUPPRESS) # Start-up benchmark, see benchmark.py
+    args = parser.parse_args(argv)
+    if args.infinite:
+        # An endless board has no size or mine total, and nothing to search or record for a fixed layout
+        for option, used in (("--canvas", args.canvas), ("--no-guess", args.no_guess), ("--record", args.record), ("--mines", args.mines)):
+            if used:
+                parser.error(f"{option} can't be used with --infinite")
+        args.tui = True
+    if args.size < 2:
+        parser.error("--size must be at least 2")
+    if args.mines is not None and not 1 <= args.mines < args.size * args.size:
+        parser.error(f"--mines must be between 1 and {args.size * args.size - 1}")
+    return args
 
 # Source: ChatGPT
 def main():
+    args = parse_args()
+    profile_from_environment() # MINESWEEPER_PROFILE=file profiles the whole session
+
+    # initialize the game board
+    if args.infinite:
+        from infinite_board import ChunkedBoardManager
+        board = ChunkedBoardManager()
+    else:
+        board = BoardManager(args.size, safe_neighborhood=args.no_guess, no_guess=args.no_guess)
+
+    # initialize the game logic with the game board, boards are pre-generated in the background so the first click doesn't block the UI
+    # (not for no-guess games: those boards depend on the first click, a pool would only compete with the search, and
+    # an infinite board builds its chunks as they are reached anyway)
+    game = GameLogic(board, None if args.no_guess or args.infinite else BoardPool(type(board)))
+    recorder = MoveRecorder(game, args.record) if args.record else None
+    # Undo/redo, except while recording: a move log only ever goes forward
+    history = None if recorder is not None else GameHistory(game)
+    store = None if args.no_stats else StatsStore(args.stats)
+
+    if args.tui:
+        # Imported here so the terminal frontend never loads Tk
+        from tui import run_tui
+        if args.infinite:
+            mines = math.inf # No flag limit, see infinite_board.py
+        else:
+            mines = args.mines or max(1, min(round(args.size * args.size * 0.15), args.size * args.size - 9))
+        run_tui(game, mines, recorder, args.first_frame_exit, history, store)
+        return
+
+    import tkinter as tk
+    from user_interface import UserInterface
+
     # declare the root for the GUI
     root = tk.Tk()
     # give the GUI the title "Minesweeper"
     root.title("Minesweeper")
 
-    # initialize the game board
-    board = BoardManager()
-
-    # initialize the game logic with the game board
-    game = GameLogic(board) 
-
     # initialize the UI with the GUI root and game logic
     # None for input handler because it hasn't been created yet and the handler needs the ui to be initialized
-    ui = UserInterface(root, game, None)
+    if args.canvas:
+        # Imported here so the default button board doesn't need the canvas module
+        from canvas_interface import CanvasUserInterface
+        ui = CanvasUserInterface(root, game, None)
+    else:
+        ui = UserInterface(root, game, None)
 
     # initialize the input handler with the game logic and UI
-    input_handler = InputHandler(game, ui)
+    input_handler = InputHandler(game, ui, recorder, history, store)
 
     # initialize the input handler in the UI
     ui.input = input_handler
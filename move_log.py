@@ -0,0 +1,238 @@
+"""
+File Name: move_log.py
+
+Description: Compact binary move logs and fast, seekable replay. MoveRecorder records every left click, right click
+and chord of a game together with the board seed and mine layout. Replay rebuilds the game headless, can seek to any
+move using periodic state snapshots instead of replaying from the start, and can run a whole log at full speed to
+bulk-verify archived games or reproduce bug reports.
+
+File layout (little-endian):
+    header  : magic b"MSWL", version (u8), size (u32), mine count (u32), seed (u64), mines in layout (u32)
+    layout  : one varint per mine, the gap between consecutive sorted flat indices (row * size + col)
+    moves   : one varint per move, (flat index << 2) | action, until the end of the file
+A move costs 1-4 bytes depending on the board size (3 bytes up to 128x128).
+
+Run with: python move_log.py game.mswl [more.mswl ...]  (replays every log and prints how each game ended)
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- move_log.py -----
+import argparse
+import os
+import struct
+import sys
+import time
+
+from board_manager import CompactBoardManager
+from game_logic import CHORD, FLAG, REVEAL, GameLogic
+
+# Source: Original work
+# The action codes (REVEAL, FLAG, CHORD from game_logic.py) are stored in the low 2 bits of every move
+MAGIC = b"MSWL"
+VERSION = 1
+HEADER = struct.Struct("<4sBIIQI")
+
+# Source: Original work
+# Moves between two replay snapshots
+SNAPSHOT_INTERVAL = 64
+
+# Source: Original work
+def write_varint(out, value):
+    # Append an unsigned LEB128 varint to a bytearray
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+# Source: Original work
+def read_varint(data, pos):
+    # Read an unsigned LEB128 varint, returns (value, next position)
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+# Source: Original work
+def apply_move(game, action, row, col):
+    # Send one recorded move to the game, returns the changed cells
+    if action == REVEAL:
+        return game.reveal_cell(row, col)
+    if action == FLAG:
+        return [(row, col)] if game.toggle_flag(row, col) else []
+    if action == CHORD:
+        return game.chord(row, col)
+    raise ValueError(f"Unknown move action {action} in the move log") # The fourth 2-bit code is unused
+
+class MoveRecorder:
+    """
+    Records the moves of the current game of a GameLogic.
+
+    The board seed and mine layout are read from the game when the log is written, since the board only exists after
+    the first click.
+    """
+
+    # Source: Original work
+    def __init__(self, game, directory=None):
+        self.game = game  # GameLogic being recorded
+        self.directory = directory  # Where finish() saves finished games, None to keep logs in memory only
+        self.moves = bytearray()  # Encoded moves of the current game
+        self.count = 0  # Number of moves recorded
+
+    # Source: Original work
+    def reset(self):
+        # Start the log of a new game
+        self.moves = bytearray()
+        self.count = 0
+
+    # Source: Original work
+    def record(self, action, row, col):
+        # Append one move (REVEAL, FLAG or CHORD) at (row, col)
+        write_varint(self.moves, ((row * self.game.board.size + col) << 2) | action)
+        self.count += 1
+
+    # Source: Original work
+    def to_bytes(self):
+        # The complete log: header, mine layout, then the moves
+        board = self.game.board
+        mines = board.mine_indices()
+        out = bytearray(HEADER.pack(MAGIC, VERSION, board.size, self.game.total_mines, board.seed or 0, len(mines)))
+        previous = 0
+        for index in mines:
+            write_varint(out, index - previous)
+            previous = index
+        out += self.moves
+        return bytes(out)
+
+    # Source: Original work
+    def save(self, path):
+        # Write the log to a file
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    # Source: Original work
+    def finish(self):
+        # Save the finished game to the log directory, returns the path (or None when not saving)
+        if self.directory is None or not self.count:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{self.game.board.seed or 0}.mswl")
+        self.save(path)
+        return path
+
+class Replay:
+    """
+    Headless replay of a move log.
+
+    Snapshots of the packed board and the game counters are taken every `snapshot_interval` moves as the replay moves
+    forward, so seek() only replays the moves after the closest snapshot.
+    """
+
+    # Source: Original work
+    def __init__(self, data, snapshot_interval=SNAPSHOT_INTERVAL):
+        magic, version, size, mine_count, seed, layout_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a Minesweeper move log")
+        pos = HEADER.size
+        mines = []
+        index = 0
+        for _ in range(layout_count):
+            gap, pos = read_varint(data, pos)
+            index += gap
+            mines.append(divmod(index, size))
+        self.moves = []  # (action, row, col) for every recorded move
+        while pos < len(data):
+            value, pos = read_varint(data, pos)
+            self.moves.append((value & 3,) + divmod(value >> 2, size))
+
+        self.size = size
+        self.seed = seed
+        self.snapshot_interval = snapshot_interval
+        board = CompactBoardManager(size)
+        board.load_layout(mines, seed)
+        self.game = GameLogic(board)
+        self.game.start_game(mine_count)
+        self.game.board_generated()
+        self.position = 0  # Number of moves applied so far
+        self.snapshots = {0: self.snapshot()}  # Move number -> saved state
+
+    # Source: Original work
+    @classmethod
+    def load(cls, path, snapshot_interval=SNAPSHOT_INTERVAL):
+        # Open a log file
+        with open(path, "rb") as f:
+            return cls(f.read(), snapshot_interval)
+
+    # Source: Original work
+    def snapshot(self):
+        # Copy of the packed board plus the counters of the game
+        game = self.game
+        return bytes(game.board.cells), game.flags, game.covered_safe, game.game_over, game.victory
+
+    # Source: Original work
+    def restore(self, snapshot):
+        # Put the game back into a saved state
+        cells, flags, covered_safe, game_over, victory = snapshot
+        game = self.game
+        game.board.cells[:] = cells
+        game.flags, game.covered_safe, game.game_over, game.victory = flags, covered_safe, game_over, victory
+
+    # Source: Original work
+    def step(self):
+        # Apply the next move, returns the changed cells
+        changed = apply_move(self.game, *self.moves[self.position])
+        self.position += 1
+        if self.position % self.snapshot_interval == 0 and self.position not in self.snapshots:
+            self.snapshots[self.position] = self.snapshot()
+        return changed
+
+    # Source: Original work
+    def seek(self, move):
+        """
+        Puts the game in the state right after `move` moves.
+
+        Input: Move number, 0 (before the first move) to len(moves)
+
+        Output: The GameLogic in that state
+        """
+        move = max(0, min(move, len(self.moves)))
+        start = max(n for n in self.snapshots if n <= move)
+        # Going forward from where the replay already is beats restoring an older snapshot
+        if not start <= self.position <= move:
+            self.restore(self.snapshots[start])
+            self.position = start
+        while self.position < move:
+            self.step()
+        return self.game
+
+    # Source: Original work
+    def run(self):
+        # Replay every remaining move at full speed
+        return self.seek(len(self.moves))
+
+# Source: Original work
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay Minesweeper move logs headless")
+    parser.add_argument("logs", nargs="+", help="move log files")
+    args = parser.parse_args(argv)
+    for path in args.logs:
+        try:
+            replay = Replay.load(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"{path}: unreadable ({e})", file=sys.stderr)
+            continue
+        game = replay.run()
+        result = "win" if game.victory else "loss" if game.game_over else "unfinished"
+        print(f"{path}: {replay.size}x{replay.size}, {game.total_mines} mines, seed {replay.seed}, {len(replay.moves)} moves -> {result}")
+
+if __name__ == "__main__":
+    main()
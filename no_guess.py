@@ -0,0 +1,149 @@
+"""
+File Name: no_guess.py
+
+Description: Generator for boards that can be solved from the safe first click without any guessing. Candidate
+layouts are played by the deterministic deduction solver (solver.py, with guessing turned off) and the validation is
+spread across a process pool, so the first accepted board comes back as soon as any worker finds one. Boards are
+identified by their seed, since BoardManager.initialize_board rebuilds the same layout from the same seed.
+
+Used through BoardManager(no_guess=True), or directly with generate_no_guess(). The search is bounded (MAX_CANDIDATES,
+TIME_BUDGET): a configuration that rarely has no-guess boards falls back to a regular board instead of stalling the first
+click, with generation_stats.accepted set to False.
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- no_guess.py -----
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from board_manager import CompactBoardManager
+from game_logic import GameLogic
+from solver import Solver
+
+# Source: Original work
+# Candidates each worker checks per task; small enough that cancelling after a success wastes little work
+BATCH_SIZE = 16
+# Default search budget for BoardManager(no_guess=True): past either limit the game falls back to a regular board
+MAX_CANDIDATES = 20000
+TIME_BUDGET = 1.0  # Seconds
+
+# Source: Original work
+# Process pool shared by every generation, so the worker start-up cost is only paid once
+_executor = None
+_executor_workers = 0
+
+# Class holding the statistics of one no-guess generation.
+# Source: Original work
+class GenerationStats:
+    def __init__(self, candidates, elapsed, accepted):
+        self.candidates = candidates  # Candidate layouts checked by the batches that finished
+        self.elapsed = elapsed  # Seconds until a board was accepted (or the search gave up)
+        self.accepted = accepted  # False if max_candidates ran out and a regular board was used instead
+
+    def __repr__(self):
+        return f"GenerationStats(candidates={self.candidates}, elapsed={self.elapsed:.3f}s, accepted={self.accepted})"
+
+# Source: Original work
+def is_no_guess(size, mine_count, safe_cell, seed, safe_neighborhood=True):
+    """
+    Checks whether the board built from `seed` can be solved from the safe cell by deduction alone.
+
+    Input: Board size, number of mines, the first clicked (row, col), the board seed, and whether the 3x3 around the safe cell is mine-free
+
+    Output: True if the solver wins without guessing
+    """
+    board = CompactBoardManager(size, safe_neighborhood=safe_neighborhood)
+    board.initialize_board(mine_count, safe_cell, seed=seed)
+    game = GameLogic(board)
+    game.start_game(mine_count)
+    game.board_generated()
+    game.reveal_cell(*safe_cell)
+    return Solver(game).solve(allow_guess=False)
+
+# Source: Original work
+def check_batch(size, mine_count, safe_cell, safe_neighborhood, seeds, deadline=None):
+    # Worker entry point: return the first seed that passes, and how many candidates were checked before it or the
+    # time.monotonic() deadline
+    for tried, seed in enumerate(seeds, 1):
+        if is_no_guess(size, mine_count, safe_cell, seed, safe_neighborhood):
+            return seed, tried
+        if deadline is not None and time.monotonic() >= deadline:
+            return None, tried
+    return None, len(seeds)
+
+# Source: Original work
+def get_executor(workers):
+    # Reuse the process pool between generations
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+# Source: Original work
+def generate_no_guess(size, mine_count, safe_cell, safe_neighborhood=True, workers=None, seed=None, max_candidates=None,
+                      time_budget=None):
+    """
+    Searches for a board that can be solved from the safe cell without guessing.
+
+    Input: Board size, number of mines, the first clicked (row, col), whether the 3x3 around it is mine-free,
+        worker processes (default: all cores, 1 checks in this process), seed for the candidate seeds, and optional
+        limits on the candidates checked and on the seconds spent
+
+    Output: (seed of the accepted board or None, GenerationStats)
+    """
+    workers = workers or os.cpu_count() or 1
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    candidates = 0
+
+    def next_seeds():
+        count = BATCH_SIZE if max_candidates is None else min(BATCH_SIZE, max_candidates - candidates - in_flight)
+        return [rng.randrange(2**63) for _ in range(max(count, 0))]
+
+    if workers == 1:
+        # No pool for a single worker, it would only add start-up and pickling cost
+        in_flight = 0
+        while (max_candidates is None or candidates < max_candidates) and (deadline is None or time.monotonic() < deadline):
+            accepted, tried = check_batch(size, mine_count, safe_cell, safe_neighborhood, next_seeds(), deadline)
+            candidates += tried
+            if accepted is not None:
+                return accepted, GenerationStats(candidates, time.perf_counter() - started, True)
+        return None, GenerationStats(candidates, time.perf_counter() - started, False)
+
+    executor = get_executor(workers)
+    pending = {}
+    in_flight = 0
+    try:
+        while True:
+            # Keep every worker busy with one batch and one queued behind it
+            while len(pending) < workers * 2:
+                seeds = next_seeds()
+                if not seeds:
+                    break
+                pending[executor.submit(check_batch, size, mine_count, safe_cell, safe_neighborhood, seeds, deadline)] = len(seeds)
+                in_flight += len(seeds)
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not pending or (remaining is not None and remaining <= 0):
+                return None, GenerationStats(candidates, time.perf_counter() - started, False)
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight -= pending.pop(future)
+                accepted, tried = future.result()
+                candidates += tried
+                if accepted is not None:
+                    return accepted, GenerationStats(candidates, time.perf_counter() - started, True)
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,270 @@
+"""
+File Name: probability.py
+
+Description: Per-cell mine probabilities for the visible state of a game, for hint overlays and for picking guesses.
+The frontier is split into independent constraint components, and the solution counts of each component are
+enumerated once and cached. After a move only the components that the reveal or flag actually touched miss the
+cache. Covered cells away from the frontier get a global-density estimate. When there are only a few components
+(small boards, endgames) they are combined exactly against the number of mines left.
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- probability.py -----
+import math
+
+from solver import FrontierIndex
+
+# Source: Original work
+# Components with more unknown cells than this are estimated instead of enumerated
+MAX_COMPONENT = 32
+# Up to this many components are combined exactly against the global mine count, beyond that the density weighting is used
+EXACT_COMPONENTS = 8
+
+# Source: Original work
+def log_comb(n, k):
+    # log of n choose k, -inf when it is 0
+    if k < 0 or k > n:
+        return float("-inf")
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+# Source: Original work
+def convolve(first, second):
+    # Multiply two {mine total: count} polynomials
+    result = {}
+    for i, a in first.items():
+        for j, b in second.items():
+            result[i + j] = result.get(i + j, 0) + a * b
+    return result
+
+# Class returned by MineProbability.probabilities(). Only frontier cells are stored, everything else shares one value.
+# Source: Original work
+class ProbabilityMap:
+    def __init__(self, game, known_mines, frontier, interior):
+        self.game = game
+        self.known_mines = known_mines  # Cells treated as mines (flags, or the solver's deduced mines)
+        self.frontier = frontier  # (row, col) -> probability for covered cells next to a revealed number
+        self.interior = interior  # Probability for every other unknown covered cell
+
+    def probability(self, row, col):
+        # Probability that the cell at (row, col) is a mine
+        if (row, col) in self.known_mines:
+            return 1.0
+        if not self.game.board.get_cell(row, col).is_covered:
+            return 0.0
+        return self.frontier.get((row, col), self.interior)
+
+class MineProbability:
+    """
+    Probability engine for one GameLogic game.
+
+    Call update() with the cells every move changed (revealed cells and toggled flags), then probabilities() to get a
+    ProbabilityMap. Flagged cells are treated as mines.
+    """
+
+    # Source: Original work
+    def __init__(self, game, frontier=None, max_component=MAX_COMPONENT):
+        self.game = game  # GameLogic being watched
+        self.max_component = max_component  # Largest component that is enumerated exactly
+        self.cache = {}  # Component -> (cells, solutions by mine total, per-cell mine counts by mine total)
+        self.owns_frontier = frontier is None  # A shared frontier (e.g. the solver's) is kept up to date by its owner
+        self.frontier = frontier or FrontierIndex(game)
+        if self.owns_frontier and not game.first_click:
+            size = game.board.size
+            for r in range(size):
+                for c in range(size):
+                    if game.board.get_cell(r, c).is_flagged:
+                        self.frontier.mark_mine(r, c)
+
+    # Source: Original work
+    def update(self, changed):
+        # Revealed cells update the frontier, covered cells in `changed` had their flag toggled
+        if not self.owns_frontier or self.game.first_click:
+            return
+        board = self.game.board
+        for row, col in changed:
+            cell = board.get_cell(row, col)
+            if not cell.is_covered:
+                self.frontier.update([(row, col)])
+            elif cell.is_flagged:
+                self.frontier.mark_mine(row, col)
+            else:
+                self.frontier.unmark_mine(row, col)
+
+    # Source: Original work
+    def components(self):
+        # Group the frontier constraints into independent components (constraints that share no unknown cell)
+        parent = {}
+
+        def find(cell):
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        constraints = []
+        for row, col in self.frontier.cells:
+            unknown, remaining = self.frontier.constraint(row, col)
+            if not unknown:
+                continue
+            constraints.append((tuple(sorted(unknown)), remaining))
+            for cell in unknown:
+                parent.setdefault(cell, cell)
+            for cell in unknown[1:]:
+                parent[find(cell)] = find(unknown[0])
+
+        groups = {}
+        for constraint in constraints:
+            groups.setdefault(find(constraint[0][0]), set()).add(constraint)
+        return [frozenset(group) for group in groups.values()]
+
+    # Source: Original work
+    def enumerate_component(self, component):
+        """
+        Counts every mine assignment of a component that satisfies all of its constraints.
+
+        Input: frozenset of (unknown cells, mines remaining) constraints
+
+        Output: (cells, {mine total: solutions}, {mine total: [solutions with a mine on each cell]}), or None if too big
+        """
+        cells = sorted({cell for unknown, _ in component for cell in unknown})
+        if len(cells) > self.max_component:
+            return None
+        index = {cell: i for i, cell in enumerate(cells)}
+        targets = []
+        watchers = [[] for _ in cells]  # Constraints that involve each cell
+        for unknown, remaining in component:
+            targets.append(remaining)
+            for cell in unknown:
+                watchers[index[cell]].append(len(targets) - 1)
+        placed = [0] * len(targets)  # Mines assigned so far in each constraint
+        open_cells = [len(unknown) for unknown, _ in component]  # Unassigned cells left in each constraint
+        assignment = [0] * len(cells)
+        totals = {}
+        per_cell = {}
+
+        def search(i, mines):
+            if i == len(cells):
+                totals[mines] = totals.get(mines, 0) + 1
+                counts = per_cell.setdefault(mines, [0] * len(cells))
+                for j, value in enumerate(assignment):
+                    counts[j] += value
+                return
+            for value in (0, 1):
+                ok = True
+                for k in watchers[i]:
+                    placed[k] += value
+                    open_cells[k] -= 1
+                    if placed[k] > targets[k] or placed[k] + open_cells[k] < targets[k]:
+                        ok = False
+                if ok:
+                    assignment[i] = value
+                    search(i + 1, mines + value)
+                for k in watchers[i]:
+                    placed[k] -= value
+                    open_cells[k] += 1
+            assignment[i] = 0
+
+        search(0, 0)
+        return cells, totals, per_cell
+
+    # Source: Original work
+    def probabilities(self):
+        """
+        Mine probability of every unknown cell in the current visible state.
+
+        Output: ProbabilityMap
+        """
+        game = self.game
+        known = self.frontier.mines
+        unknown_count = game.covered_safe + game.total_mines - len(known) # Covered cells that are not known mines
+        mines_left = max(game.total_mines - len(known), 0)
+        if game.first_click:
+            return ProbabilityMap(game, known, {}, game.total_mines / (game.board.size * game.board.size))
+        if unknown_count <= 0:
+            return ProbabilityMap(game, known, {}, 0.0)
+
+        cache = {}
+        results = []
+        for component in self.components():
+            result = self.cache.get(component) or cache.get(component)
+            if result is None:
+                # Too big to enumerate, estimate each cell from the constraints it appears in
+                result = self.enumerate_component(component) or self.estimate_component(component)
+            cache[component] = result
+            results.append(result)
+        self.cache = cache # Drop the components that no longer exist
+
+        frontier_cells = sum(len(cells) for cells, _, _ in results)
+        interior_count = unknown_count - frontier_cells
+        if len(results) <= EXACT_COMPONENTS and all(totals is not None for _, totals, _ in results):
+            frontier, interior = self.combine_exact(results, mines_left, interior_count)
+        else:
+            frontier, interior = self.combine_density(results, mines_left, unknown_count, interior_count)
+        return ProbabilityMap(game, known, frontier, interior)
+
+    # Source: Original work
+    def combine_exact(self, results, mines_left, interior_count):
+        # Weight every combination of component mine totals by the ways the rest of the mines fit in the interior
+        def weight(frontier_mines):
+            return log_comb(interior_count, mines_left - frontier_mines)
+
+        joint = {0: 1}
+        for _, totals, _ in results:
+            joint = convolve(joint, totals)
+        logs = {k: weight(k) for k in joint}
+        top = max(logs.values())
+        if top == float("-inf"):
+            return {}, 0.0 # Visible state is inconsistent with the mine count (e.g. a wrong flag)
+        scale = {k: math.exp(value - top) for k, value in logs.items()}
+        norm = sum(float(count) * scale[k] for k, count in joint.items())
+
+        frontier = {}
+        for i, (cells, totals, per_cell) in enumerate(results):
+            # Mine totals of all the other components
+            others = {0: 1}
+            for j, (_, other_totals, _) in enumerate(results):
+                if j != i:
+                    others = convolve(others, other_totals)
+            factor = {k: sum(float(count) * math.exp(weight(k + rest) - top) for rest, count in others.items()) for k in totals}
+            for j, cell in enumerate(cells):
+                frontier[cell] = sum(per_cell[k][j] * factor[k] for k in totals) / norm
+        if interior_count <= 0:
+            return frontier, 0.0
+        interior = sum(float(count) * scale[k] * (mines_left - k) for k, count in joint.items()) / norm / interior_count
+        return frontier, interior
+
+    # Source: Original work
+    def combine_density(self, results, mines_left, unknown_count, interior_count):
+        # Each solution is weighted by the odds of its mine total under the global density
+        density = min(mines_left / unknown_count, 0.999)
+        odds = density / (1 - density)
+        frontier = {}
+        expected = 0.0
+        for cells, totals, per_cell in results:
+            if totals is None:
+                frontier.update(per_cell)
+                expected += sum(per_cell.values())
+                continue
+            weight = {k: count * odds ** k for k, count in totals.items()}
+            norm = sum(weight.values()) or 1.0
+            expected += sum(k * w for k, w in weight.items()) / norm
+            for j, cell in enumerate(cells):
+                frontier[cell] = sum(per_cell[k][j] * odds ** k for k in totals) / norm
+        interior = min(max((mines_left - expected) / interior_count, 0.0), 1.0) if interior_count > 0 else 0.0
+        return frontier, interior
+
+    # Source: Original work
+    def estimate_component(self, component):
+        # Average of remaining/unknown over the constraints each cell appears in
+        sums = {}
+        for unknown, remaining in component:
+            for cell in unknown:
+                total, count = sums.get(cell, (0.0, 0))
+                sums[cell] = (total + remaining / len(unknown), count + 1)
+        return list(sums), None, {cell: total / count for cell, (total, count) in sums.items()}
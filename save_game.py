@@ -0,0 +1,191 @@
+"""
+File Name: save_game.py
+
+Description: Saves an in-progress game to disk and resumes it later. The file is a fixed-layout binary: a header
+padded to one 4 KiB page (size, mine count, flags, first_click, game_over, ...) followed by the packed one-byte-per-cell
+array used by CompactBoardManager. Loading memory-maps the file, so even a huge board opens instantly and only the
+pages that get touched are read from disk. A GameSaver remembers which pages changed since its last save and rewrites
+only those, so autosaving a very large game every few seconds stays cheap. An incremental save marks the header
+incomplete before it touches any page and only marks it complete again with the final counters, so a save that was cut
+short is refused on load instead of resuming cells that don't match their counters.
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- save_game.py -----
+import mmap
+import os
+import struct
+
+from board_manager import COVERED_BIT, DIRTY_PAGE_SHIFT, FLAGGED_BIT, MINE_BIT, ADJACENT_SHIFT, CompactBoardManager
+from game_logic import GameLogic
+
+# Source: Original work
+# Header layout: magic, version, size, total mines, flags placed, covered safe cells, seed, first_click, game_over, victory,
+# complete (cleared while an incremental save is under way)
+MAGIC = b"MSWS"
+VERSION = 2
+HEADER = struct.Struct("<4sBIIIQQ????")
+COMPLETE_OFFSET = HEADER.size - 1  # Offset of the complete flag in the header
+PAGE_SIZE = 1 << DIRTY_PAGE_SHIFT  # The cell array starts on a page boundary so file pages and array pages line up
+
+# Compact board whose cells are a copy-on-write memory map of a save file.
+# Source: Original work
+class MappedBoardManager(CompactBoardManager):
+    def __init__(self, size, mapping, path):
+        super().__init__(size)
+        self.mapping = mapping  # Private (copy-on-write) map of the whole file, edits never reach the file directly
+        self.path = path  # File the board was loaded from
+        self.cells = memoryview(mapping)[PAGE_SIZE:PAGE_SIZE + size * size]  # The layout is read from these bytes on demand
+
+    # Source: Original work
+    def detach(self):
+        # Copy the cells out of the map and close it, Windows refuses to replace a file that is still mapped
+        if self.mapping is None:
+            return
+        view = self.cells
+        self.cells = bytearray(view)
+        view.release()
+        self.mapping.close()
+        self.mapping = None
+
+# Source: Original work
+def pack_header(game):
+    # Header bytes for the current state of a game, padded to a full page
+    board = game.board
+    header = HEADER.pack(MAGIC, VERSION, board.size, game.total_mines, game.flags, game.covered_safe, board.seed or 0,
+                         game.first_click, game.game_over, game.victory, True)
+    return header.ljust(PAGE_SIZE, b"\0")
+
+# Source: Original work
+def pack_cells(board):
+    # Packed cell array of any board type
+    if isinstance(board, CompactBoardManager):
+        return bytes(board.cells)
+    out = bytearray(board.size * board.size)
+    for r in range(board.size):
+        for c in range(board.size):
+            cell = board.get_cell(r, c)
+            out[r * board.size + c] = (MINE_BIT * cell.is_mine | COVERED_BIT * cell.is_covered |
+                                       FLAGGED_BIT * cell.is_flagged | cell.adjacent << ADJACENT_SHIFT)
+    return bytes(out)
+
+# Source: Original work
+def sync(f):
+    # Push a file's writes to the disk, so a crash can't reorder them with the writes that follow
+    f.flush()
+    os.fsync(f.fileno())
+
+# Source: Original work
+def load_game(path):
+    """
+    Opens a save file. The cell array is memory-mapped, not read.
+
+    Input: Path of the save file
+
+    Output: GameLogic with a MappedBoardManager (a plain CompactBoardManager if the board was never generated)
+    """
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        magic, version, size, total_mines, flags, covered_safe, seed, first_click, game_over, victory, complete = HEADER.unpack_from(mapping)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a Minesweeper save file")
+        if not complete:
+            raise ValueError("Save file was only partly written")
+        if not first_click and len(mapping) < PAGE_SIZE + size * size:
+            raise ValueError("Save file is truncated")
+    except (ValueError, struct.error):
+        mapping.close()
+        raise
+    if first_click:
+        mapping.close() # Nothing to map before the board exists
+        board = CompactBoardManager(size)
+    else:
+        board = MappedBoardManager(size, mapping, path)
+        board.seed = seed
+        board.track_changes()
+    game = GameLogic(board)
+    game.start_game(total_mines)
+    game.flags, game.covered_safe, game.first_click, game.game_over, game.victory = flags, covered_safe, first_click, game_over, victory
+    return game
+
+class GameSaver:
+    """
+    Saves one game to one file over and over (e.g. autosave).
+
+    The first save writes the whole file, later saves rewrite the header plus only the pages of the cell array that
+    changed since the previous save. A game loaded from the same path starts out incremental.
+    """
+
+    # Source: Original work
+    def __init__(self, game, path):
+        self.game = game  # GameLogic being saved
+        self.path = path  # File to save to
+        self.saved_cells = None  # The cell array the file currently matches (incremental saves are only safe for that array)
+        board = game.board
+        if isinstance(board, MappedBoardManager) and os.path.abspath(board.path) == os.path.abspath(path):
+            self.saved_cells = board.cells
+
+    # Source: Original work
+    def save(self):
+        """
+        Writes the game to the file. An incremental save clears the header's complete flag (flushed to disk) before
+        writing the changed pages, and sets it again together with the new counters once they are all written.
+
+        Input: None
+
+        Output: Number of cell-array bytes written (the header is always rewritten)
+        """
+        board = self.game.board
+        incremental = (self.saved_cells is not None and board.cells is self.saved_cells
+                       and board.dirty_pages is not None and os.path.exists(self.path))
+        if not incremental:
+            return self.save_full()
+
+        pages = sorted(board.dirty_pages)
+        board.dirty_pages.clear()
+        written = 0
+        with open(self.path, "r+b") as f:
+            f.seek(COMPLETE_OFFSET)
+            f.write(b"\0")
+            sync(f)
+            for page in pages:
+                start = page << DIRTY_PAGE_SHIFT
+                chunk = bytes(board.cells[start:start + PAGE_SIZE])
+                f.seek(PAGE_SIZE + start)
+                f.write(chunk)
+                written += len(chunk)
+            sync(f) # Every page is on disk before the header says the file is complete again
+            f.seek(0)
+            f.write(pack_header(self.game))
+            sync(f)
+        return written
+
+    # Source: Original work
+    def save_full(self):
+        # Write the whole file through a temporary file so a crash never leaves half a save behind
+        board = self.game.board
+        cells = b"" if self.game.first_click else pack_cells(board)
+        temp = self.path + ".tmp"
+        with open(temp, "wb") as f:
+            f.write(pack_header(self.game))
+            f.write(cells)
+            sync(f)
+        if isinstance(board, MappedBoardManager) and os.path.abspath(board.path) == os.path.abspath(self.path):
+            board.detach() # The board is mapped from the file being replaced
+        os.replace(temp, self.path)
+        if isinstance(board, CompactBoardManager) and not self.game.first_click:
+            board.track_changes()
+            self.saved_cells = board.cells
+        return len(cells)
+
+# Source: Original work
+def save_game(game, path):
+    # One-off full save
+    return GameSaver(game, path).save_full()
@@ -0,0 +1,254 @@
+"""
+File Name: server.py
+
+Description: Headless network front end over GameLogic. An asyncio server on localhost speaks JSON lines (one JSON
+object per line each way) and hosts any number of independent game sessions in one process. Every session plays on a
+CompactBoardManager, sessions that sit idle are evicted, and replies only ever carry the cells that changed.
+
+Requests (an optional "id" is echoed back in the reply):
+    {"op": "new", "size": 16, "mines": 40, "seed": 123}               -> {"session": "...", "size": 16, "mines": 40}
+    {"op": "reveal" | "flag" | "chord", "session": "...", "row": 3, "col": 4}
+    {"op": "act", "session": "...", "actions": [["reveal", 3, 4], ["flag", 0, 0]]}   (one transaction, see GameLogic.apply_actions)
+        -> {"changed": [[row, col, value], ...], "state": "playing" | "won" | "lost", "flags": 1}
+    {"op": "close", "session": "..."}                                  -> {"closed": true}
+    {"op": "stats"}                                                    -> {"sessions": 12, "requests": 3456, "evicted": 7}
+Cell values: 0-8 revealed number, -1 flagged, -2 covered (sent when a flag is removed), -3 revealed mine.
+Errors come back as {"error": "..."}.
+
+Run with: python server.py --port 8765   (then drive it with load_generator.py)
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- server.py -----
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+
+from board_manager import CompactBoardManager
+from game_logic import CHORD, FLAG, REVEAL, GameLogic
+
+# Source: Original work
+ACTIONS = {"reveal": REVEAL, "flag": FLAG, "chord": CHORD}
+FLAGGED = -1
+COVERED = -2
+MINE = -3
+MAX_SIZE = 1000  # Largest board a client may ask for
+IDLE_TIMEOUT = 300.0  # Seconds without a request before a session is evicted
+SWEEP_INTERVAL = 5.0  # Seconds between idle sweeps
+MAX_SESSIONS = 100000  # Sessions kept at most, the least recently used one goes first past this
+
+# Class holding one hosted game.
+# Source: Original work
+class Session:
+    __slots__ = ("game", "last_used")
+
+    def __init__(self, game):
+        self.game = game  # GameLogic on a CompactBoardManager
+        self.last_used = time.monotonic()  # For idle eviction
+
+# Class raised for requests that can't be served, the message goes back to the client.
+# Source: Original work
+class RequestError(Exception):
+    pass
+
+class GameServer:
+    """
+    Session store plus the request handlers. Sessions live in an OrderedDict in least-recently-used order, so idle
+    eviction only ever looks at the front.
+    """
+
+    # Source: Original work
+    def __init__(self, idle_timeout=IDLE_TIMEOUT, max_sessions=MAX_SESSIONS):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.sessions = OrderedDict()  # Session id -> Session, least recently used first
+        self.requests = 0  # Requests handled since start
+        self.evicted = 0  # Sessions dropped for being idle or for the session limit
+
+    # Source: Original work
+    def new_session(self, request):
+        # Start a game; the board is only generated by the first reveal, like in the GUI
+        size = request.get("size", 10)
+        mines = request.get("mines", 10)
+        seed = request.get("seed")
+        if not isinstance(size, int) or not 2 <= size <= MAX_SIZE:
+            raise RequestError(f"size must be an integer from 2 to {MAX_SIZE}")
+        if not isinstance(mines, int) or not 1 <= mines < size * size:
+            raise RequestError("mines must be an integer from 1 to size*size-1")
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            raise RequestError("seed must be an integer")
+        game = GameLogic(CompactBoardManager(size, seed=seed))
+        game.start_game(mines)
+        session_id = os.urandom(8).hex()
+        self.sessions[session_id] = Session(game)
+        while len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+            self.evicted += 1
+        return {"session": session_id, "size": size, "mines": mines}
+
+    # Source: Original work
+    def get_session(self, request):
+        # Look a session up and mark it as just used
+        session_id = request.get("session")
+        if not isinstance(session_id, str):
+            raise RequestError("session must be a string")
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise RequestError("unknown or expired session")
+        session.last_used = time.monotonic()
+        self.sessions.move_to_end(session_id)
+        return session
+
+    # Source: Original work
+    def play(self, request):
+        # Apply one action, or a list of them, and reply with only the cells that changed
+        game = self.get_session(request).game
+        size = game.board.size
+        if request["op"] == "act":
+            raw = request.get("actions")
+            if not isinstance(raw, list):
+                raise RequestError("actions must be a list of [action, row, col]")
+        else:
+            raw = [(request["op"], request.get("row"), request.get("col"))]
+        actions = []
+        for item in raw:
+            if not isinstance(item, (list, tuple)) or len(item) != 3 or not isinstance(item[0], str) or item[0] not in ACTIONS:
+                raise RequestError("each action must be [\"reveal\" | \"flag\" | \"chord\", row, col]")
+            name, row, col = item
+            if not isinstance(row, int) or not isinstance(col, int) or not (0 <= row < size and 0 <= col < size):
+                raise RequestError(f"row and col must be integers from 0 to {size - 1}")
+            actions.append((ACTIONS[name], row, col))
+
+        changed = game.apply_actions(actions)
+        board = game.board
+        cells = []
+        for row, col in changed:
+            cell = board.get_cell(row, col)
+            if cell.is_covered:
+                value = FLAGGED if cell.is_flagged else COVERED
+            else:
+                value = MINE if cell.is_mine else cell.adjacent
+            cells.append([row, col, value])
+        state = "won" if game.victory else "lost" if game.game_over else "playing"
+        return {"changed": cells, "state": state, "flags": game.flags}
+
+    # Source: Original work
+    def handle(self, request):
+        """
+        Serves one decoded request.
+
+        Input: Request dict
+
+        Output: Reply dict
+        """
+        self.requests += 1
+        op = request.get("op")
+        if not isinstance(op, str):
+            raise RequestError("op must be a string")
+        if op == "new":
+            return self.new_session(request)
+        if op in ACTIONS or op == "act":
+            return self.play(request)
+        if op == "close":
+            session_id = request.get("session")
+            if not isinstance(session_id, str):
+                raise RequestError("session must be a string")
+            return {"closed": self.sessions.pop(session_id, None) is not None}
+        if op == "stats":
+            return {"sessions": len(self.sessions), "requests": self.requests, "evicted": self.evicted}
+        raise RequestError(f"unknown op {op!r}")
+
+    # Source: Original work
+    def evict_idle(self, now=None):
+        # Drop every session that has not been used for idle_timeout seconds, returns how many went
+        now = time.monotonic() if now is None else now
+        dropped = 0
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if now - session.last_used < self.idle_timeout:
+                break # Everything behind it was used more recently
+            del self.sessions[session_id]
+            dropped += 1
+        self.evicted += dropped
+        return dropped
+
+    # Source: Original work
+    async def sweep(self):
+        # Background task: evict idle sessions every SWEEP_INTERVAL seconds
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            self.evict_idle()
+
+    # Source: Original work
+    async def serve_client(self, reader, writer):
+        # One connection: read a request line, write a reply line, until the client hangs up
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError: # Line longer than the stream limit
+                    writer.write(b'{"error": "request too long"}\n')
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError: # Bad JSON or bad UTF-8
+                    request = None
+                if not isinstance(request, dict):
+                    request, reply = {}, {"error": "request must be a JSON object"}
+                else:
+                    try:
+                        reply = self.handle(request)
+                    except RequestError as e:
+                        reply = {"error": str(e)}
+                    except (TypeError, ValueError) as e: # A field of a type no check above expected
+                        reply = {"error": f"bad request: {e}"}
+                if "id" in request:
+                    reply["id"] = request["id"]
+                writer.write(json.dumps(reply, separators=(",", ":")).encode() + b"\n")
+                # Only wait for the socket when the client isn't reading its replies
+                if writer.transport.get_write_buffer_size() > 1 << 16:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    # Source: Original work
+    async def serve(self, host="127.0.0.1", port=8765):
+        # Run the server until cancelled
+        server = await asyncio.start_server(self.serve_client, host, port)
+        sweeper = asyncio.create_task(self.sweep())
+        address = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Serving Minesweeper sessions on {address}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+
+# Source: Original work
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Minesweeper game server (JSON lines over TCP)")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: localhost only)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT, help="seconds before an unused session is evicted")
+    parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS, help="sessions kept at most")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(GameServer(args.idle_timeout, args.max_sessions).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
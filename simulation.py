@@ -0,0 +1,176 @@
+"""
+File Name: simulation.py
+
+Description: Headless batch simulation of Minesweeper games, no Tk needed. Plays large numbers of games with either
+random clicks or a pluggable strategy, spreads them across a ProcessPoolExecutor with a separate seed for every game,
+and streams aggregate results (win rate, clicks per game, games/sec) instead of keeping every game in memory.
+
+A strategy is a module-level (picklable) callable strategy(game, rng) that is called once per game and returns a
+move picker. The move picker is called as next_move(changed) with the cells revealed by the previous move (empty on
+the first move) and returns the (row, col) to reveal next.
+
+Run with: python simulation.py --games 100000 --mines 15
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- simulation.py -----
+import argparse
+import importlib
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from board_manager import BoardManager
+from game_logic import GameLogic
+
+# Class holding the running totals of a simulation. Only counters are kept, never the games themselves.
+# Source: Original work
+class SimulationStats:
+    def __init__(self):
+        self.games = 0  # Games finished so far
+        self.wins = 0  # Games that ended in a victory
+        self.clicks = 0  # Total reveals over all finished games
+        self.elapsed = 0.0  # Wall clock seconds since the simulation started
+
+    def add(self, games, wins, clicks):
+        # Fold one finished batch into the totals
+        self.games += games
+        self.wins += wins
+        self.clicks += clicks
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def clicks_per_game(self):
+        return self.clicks / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self):
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (f"{self.games} games | win rate {self.win_rate:.2%} | {self.clicks_per_game:.2f} clicks/game | "
+                f"{self.games_per_second:,.0f} games/sec")
+
+# Source: Original work
+def random_strategy(game, rng):
+    # Click covered cells in a random order, skipping the ones earlier cascades already revealed
+    size = game.board.size
+    order = list(range(size * size))
+    rng.shuffle(order)
+    position = 0
+
+    def next_move(changed):
+        nonlocal position
+        while True:
+            row, col = divmod(order[position], size)
+            position += 1
+            # The board only exists after the first click, and every cell is covered before it
+            if game.first_click or game.board.get_cell(row, col).is_covered:
+                return row, col
+
+    return next_move
+
+# Source: Original work
+def play_game(size, mine_count, seed, strategy=random_strategy):
+    """
+    Plays one headless game to the end.
+
+    Input: Board size, number of mines, the seed for this game, and the strategy
+
+    Output: (victory, number of reveals)
+    """
+    rng = random.Random(f"strategy-{seed}") # Separate stream from the board's, so clicks and mines are independent
+    game = GameLogic(BoardManager(size, seed=seed))
+    game.start_game(mine_count)
+    next_move = strategy(game, rng)
+    changed = []
+    clicks = 0
+    while not game.game_over:
+        changed = game.reveal_cell(*next_move(changed))
+        clicks += 1
+    return game.victory, clicks
+
+# Source: Original work
+def run_batch(size, mine_count, strategy, base_seed, start, count):
+    # Worker entry point: play games start..start+count and only send the totals back
+    wins = clicks = 0
+    for index in range(start, start + count):
+        victory, game_clicks = play_game(size, mine_count, (base_seed << 32) | index, strategy)
+        wins += victory
+        clicks += game_clicks
+    return count, wins, clicks
+
+# Source: Original work
+def simulate(games, size=10, mine_count=10, strategy=random_strategy, workers=None, seed=0, batch_size=1000):
+    """
+    Plays `games` games across a process pool and yields the running SimulationStats every time a batch finishes.
+
+    Game i always uses the same seed for a given base seed, so results are reproducible whatever the worker count.
+    Only a couple of batches per worker are in flight at once, so memory stays flat for millions of games.
+
+    Input: Number of games, board size, mines per game, strategy, worker count (default: all cores), base seed and games per batch
+
+    Output: Generator of SimulationStats (the same object, updated in place)
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = SimulationStats()
+    started = time.perf_counter()
+    batches = ((start, min(batch_size, games - start)) for start in range(0, games, batch_size))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for start, count in batches:
+            pending.add(pool.submit(run_batch, size, mine_count, strategy, seed, start, count))
+            if len(pending) < workers * 2:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stats.add(*future.result())
+            stats.elapsed = time.perf_counter() - started
+            yield stats
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stats.add(*future.result())
+            stats.elapsed = time.perf_counter() - started
+            yield stats
+
+# Source: Original work
+def load_strategy(path):
+    # Resolve a "module:function" strategy path
+    module_name, _, name = path.partition(":")
+    return getattr(importlib.import_module(module_name), name)
+
+# Source: Original work
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Minesweeper simulation")
+    parser.add_argument("--games", type=int, default=10000, help="number of games to play")
+    parser.add_argument("--size", type=int, default=10, help="number of rows and columns on the board")
+    parser.add_argument("--mines", type=int, default=10, help="mines per game")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed, every game derives its own seed from it")
+    parser.add_argument("--batch-size", type=int, default=1000, help="games per worker task")
+    parser.add_argument("--strategy", default="simulation:random_strategy", help="strategy as module:function")
+    args = parser.parse_args(argv)
+
+    stats = SimulationStats()
+    last_report = 0.0
+    for stats in simulate(args.games, args.size, args.mines, load_strategy(args.strategy), args.workers, args.seed, args.batch_size):
+        # Report at most once a second so printing never becomes the bottleneck
+        if stats.elapsed - last_report >= 1.0:
+            print(stats, flush=True)
+            last_report = stats.elapsed
+    print(stats)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+File Name: stats_store.py
+
+Description: Statistics and leaderboard store. Every finished game (size, mine count, seed, duration, clicks, result) is
+kept in a local SQLite database. Writes never happen on the caller's thread: record() only queues the game, and a
+background writer thread commits whatever has queued up in one transaction per batch, so the Tk loop never waits on
+the disk and bulk simulations can push millions of games through record_many().
+
+The writer also keeps the aggregates the stats view needs up to date in the same transaction: totals per board
+configuration and per day. Best times come from a partial index over won games, so every query reads a handful of rows
+however many games are stored.
+
+Run with: python stats_store.py [--size 10 --mines 10]   (prints the stats of the default database)
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- stats_store.py -----
+import argparse
+import atexit
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+# Source: Original work
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".minesweeper_stats.db")
+BATCH_SIZE = 50000  # Most games committed in one transaction
+SCHEMA = """
+PRAGMA journal_mode = WAL;
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished REAL NOT NULL,
+    size INTEGER NOT NULL,
+    mines INTEGER NOT NULL,
+    seed INTEGER,
+    duration REAL NOT NULL,
+    clicks INTEGER NOT NULL,
+    won INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_best_times ON games (size, mines, duration) WHERE won = 1;
+CREATE TABLE IF NOT EXISTS config_stats (
+    size INTEGER NOT NULL,
+    mines INTEGER NOT NULL,
+    played INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    best_time REAL,
+    win_time REAL NOT NULL,
+    PRIMARY KEY (size, mines)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS daily_stats (
+    size INTEGER NOT NULL,
+    mines INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    played INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    PRIMARY KEY (size, mines, day)
+) WITHOUT ROWID;
+"""
+INSERT_GAME = "INSERT INTO games (finished, size, mines, seed, duration, clicks, won) VALUES (?, ?, ?, ?, ?, ?, ?)"
+UPSERT_CONFIG = """
+INSERT INTO config_stats (size, mines, played, won, best_time, win_time) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (size, mines) DO UPDATE SET
+    played = played + excluded.played,
+    won = won + excluded.won,
+    best_time = min(coalesce(best_time, excluded.best_time), coalesce(excluded.best_time, best_time)),
+    win_time = win_time + excluded.win_time
+"""
+UPSERT_DAY = """
+INSERT INTO daily_stats (size, mines, day, played, won) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (size, mines, day) DO UPDATE SET played = played + excluded.played, won = won + excluded.won
+"""
+
+class StatsStore:
+    """
+    Finished games plus their aggregates in one SQLite file.
+
+    The writer thread owns its own connection, the query methods use a second one on the caller's thread. The
+    database runs in WAL mode, so queries see everything committed so far without waiting for the writer.
+    """
+
+    # Source: Original work
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path  # Database file
+        with sqlite3.connect(path) as db:
+            db.executescript(SCHEMA)
+        db.close()
+        self.reader = None  # Connection for queries, opened on first use
+        self.queue = queue.Queue()  # Lists of game rows waiting for the writer, None to stop it
+        self.writer = threading.Thread(target=self.write_loop, name="stats-writer", daemon=True)
+        self.writer.start()
+        atexit.register(self.close) # Commit whatever is still queued when the program exits
+
+    # Source: Original work
+    def record(self, size, mines, seed, duration, clicks, won, finished=None):
+        # Queue one finished game (returns right away, the writer thread stores it)
+        finished = time.time() if finished is None else finished
+        self.queue.put([(finished, size, mines, seed, duration, clicks, int(bool(won)))])
+
+    # Source: Original work
+    def record_many(self, games):
+        # Queue many games at once (bulk simulations): (finished, size, mines, seed, duration, clicks, won) tuples
+        self.queue.put([(finished, size, mines, seed, duration, clicks, int(bool(won)))
+                        for finished, size, mines, seed, duration, clicks, won in games])
+
+    # Source: Original work
+    def flush(self):
+        # Wait until every queued game is committed
+        self.queue.join()
+
+    # Source: Original work
+    def close(self):
+        # Commit the queue, stop the writer and close the connections (safe to call twice)
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+    # Source: Original work
+    def write_loop(self):
+        """
+        Writer thread: waits for queued games, then takes everything else already queued (up to BATCH_SIZE games) and
+        commits it as one transaction together with the aggregate updates.
+
+        Input: None
+
+        Output: None
+        """
+        db = sqlite3.connect(self.path)
+        running = True
+        while running:
+            batches = [self.queue.get()]
+            rows = batches[0] or []
+            while len(rows) < BATCH_SIZE:
+                try:
+                    batch = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                batches.append(batch)
+                rows += batch or []
+            running = None not in batches
+            try:
+                if rows:
+                    with db:
+                        self.write_rows(db, rows)
+            except sqlite3.Error as e:
+                print(f"Could not save game stats: {e}", file=sys.stderr)
+            finally:
+                for _ in batches:
+                    self.queue.task_done()
+        db.close()
+
+    # Source: Original work
+    def write_rows(self, db, rows):
+        # Insert the games and fold them into the per-configuration and per-day totals
+        db.executemany(INSERT_GAME, rows)
+        configs = {}
+        days = {}
+        for finished, size, mines, seed, duration, clicks, won in rows:
+            config = configs.get((size, mines))
+            if config is None:
+                config = configs[(size, mines)] = [0, 0, None, 0.0]
+            config[0] += 1
+            if won:
+                config[1] += 1
+                config[2] = duration if config[2] is None else min(config[2], duration)
+                config[3] += duration
+            day = days.setdefault((size, mines, time.strftime("%Y-%m-%d", time.localtime(finished))), [0, 0])
+            day[0] += 1
+            day[1] += won
+        db.executemany(UPSERT_CONFIG, [key + tuple(value) for key, value in configs.items()])
+        db.executemany(UPSERT_DAY, [key + tuple(value) for key, value in days.items()])
+
+    # Source: Original work
+    def query(self, sql, parameters=()):
+        if self.reader is None:
+            self.reader = sqlite3.connect(self.path)
+        return self.reader.execute(sql, parameters).fetchall()
+
+    # Source: Original work
+    def best_times(self, size, mines, limit=10):
+        # Fastest won games of a configuration: [(duration, clicks, finished, seed)], read from the partial index
+        return self.query("SELECT duration, clicks, finished, seed FROM games WHERE size = ? AND mines = ? AND won = 1 "
+                          "ORDER BY duration LIMIT ?", (size, mines, limit))
+
+    # Source: Original work
+    def summary(self, size=None, mines=None):
+        """
+        Totals per configuration, from the aggregate table.
+
+        Input: Optional size and mine count to narrow it down to one configuration
+
+        Output: List of dicts with size, mines, played, won, win_rate, best_time and mean_win_time
+        """
+        sql = "SELECT size, mines, played, won, best_time, win_time FROM config_stats"
+        if size is not None and mines is not None:
+            rows = self.query(sql + " WHERE size = ? AND mines = ?", (size, mines))
+        else:
+            rows = self.query(sql + " ORDER BY size, mines")
+        return [{"size": size, "mines": mines, "played": played, "won": won, "win_rate": won / played,
+                 "best_time": best_time, "mean_win_time": win_time / won if won else None}
+                for size, mines, played, won, best_time, win_time in rows]
+
+    # Source: Original work
+    def win_rate_by_day(self, size, mines, days=30):
+        # [(day, played, won, win rate)] for the last `days` days that have games, oldest first
+        rows = self.query("SELECT day, played, won FROM daily_stats WHERE size = ? AND mines = ? ORDER BY day DESC LIMIT ?",
+                          (size, mines, days))
+        return [(day, played, won, won / played) for day, played, won in reversed(rows)]
+
+    # Source: Original work
+    def report(self, size, mines):
+        # Text for the stats view of one configuration
+        summary = self.summary(size, mines)
+        if not summary:
+            return f"No games played on {size}x{size} with {mines} mines yet."
+        s = summary[0]
+        lines = [f"{size}x{size}, {mines} mines: {s['played']} played, {s['won']} won ({s['win_rate']:.0%})"]
+        if s["best_time"] is not None:
+            lines.append(f"Best time {s['best_time']:.1f}s, mean winning time {s['mean_win_time']:.1f}s")
+            lines.append("Best times:")
+            lines += [f"  {i:2}. {duration:7.1f}s  {clicks:5} clicks  {time.strftime('%Y-%m-%d', time.localtime(finished))}"
+                      for i, (duration, clicks, finished, _) in enumerate(self.best_times(size, mines), 1)]
+        days = self.win_rate_by_day(size, mines, 7)
+        if days:
+            lines.append("Win rate by day:")
+            lines += [f"  {day}  {won:6}/{played:<6} {rate:.0%}" for day, played, won, rate in days]
+        return "\n".join(lines)
+
+# Source: Original work
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show Minesweeper game statistics")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="stats database (default: ~/.minesweeper_stats.db)")
+    parser.add_argument("--size", type=int, default=None, help="board size to show in detail (with --mines)")
+    parser.add_argument("--mines", type=int, default=None)
+    args = parser.parse_args(argv)
+    store = StatsStore(args.db)
+    if args.size is not None and args.mines is not None:
+        print(store.report(args.size, args.mines))
+    else:
+        for s in store.summary():
+            best = "-" if s["best_time"] is None else f"{s['best_time']:.1f}s"
+            print(f"{s['size']:4}x{s['size']:<4} {s['mines']:6} mines  {s['played']:9} played  {s['win_rate']:5.0%} won  best {best}")
+    store.close()
+
+if __name__ == "__main__":
+    main()
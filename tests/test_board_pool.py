@@ -0,0 +1,71 @@
+"""
+File Name: test_board_pool.py
+
+Description: Regression tests for BoardPool: a pooled board, adapted to the first click, has the same layout that
+initialize_board builds from its seed and that first click, so seeds stay meaningful on the default (pooled) path.
+
+Run with: python -m unittest discover tests   (from the project root)
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- test_board_pool.py -----
+import random
+import time
+import unittest
+from functools import partial
+
+from board_manager import BoardManager, CompactBoardManager
+from board_pool import BoardPool
+from game_logic import GameLogic
+
+# Source: Original work
+def layout(board):
+    # Mine and adjacent count of every cell
+    return [(board.get_cell(r, c).is_mine, board.get_cell(r, c).adjacent) for r in range(board.size) for c in range(board.size)]
+
+class BoardPoolTest(unittest.TestCase):
+    # Source: Original work
+    def test_pooled_board_rebuilds_from_seed(self):
+        rng = random.Random(7)
+        for board_class in (BoardManager, CompactBoardManager):
+            for safe_neighborhood in (False, True):
+                factory = partial(board_class, safe_neighborhood=safe_neighborhood)
+                pool = BoardPool(factory, seed=rng.randrange(2**32))
+                try:
+                    for _ in range(20):
+                        size = rng.randint(4, 16)
+                        mines = rng.randint(1, size * size // 3)
+                        safe_cell = (rng.randrange(size), rng.randrange(size))
+                        pool.prefetch(size, mines)
+                        pooled = None
+                        while pooled is None:
+                            time.sleep(0.001)
+                            pooled = pool.take(size, mines, safe_cell)
+                        rebuilt = factory(size)
+                        rebuilt.initialize_board(mines, safe_cell, seed=pooled.seed)
+                        self.assertEqual(layout(pooled), layout(rebuilt))
+                        self.assertFalse(pooled.get_cell(*safe_cell).is_mine)
+                finally:
+                    pool.close()
+
+    # Source: Original work
+    def test_big_boards_and_no_guess_games_hold_fewer_boards(self):
+        pool = BoardPool(CompactBoardManager, seed=8, max_cells=10000)
+        try:
+            self.assertEqual(pool.capacity_for(50), 2)
+            self.assertEqual(pool.capacity_for(80), 1)
+            self.assertEqual(pool.capacity_for(1000), 1)
+            # A no-guess board depends on the first click, so starting such a game asks the pool for nothing
+            GameLogic(BoardManager(10, no_guess=True), pool).start_game(10)
+            self.assertEqual(len(pool.ready), 0)
+        finally:
+            pool.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+File Name: test_game_logic.py
+
+Description: Regression tests for the GameLogic flood fill: it reveals the same cells as the original recursive
+reveal_cell, its cost follows the size of the region rather than the board, and the running covered_safe count always
+matches a recount of the board.
+
+Run with: python -m unittest discover tests   (from the project root)
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- test_game_logic.py -----
+import gc
+import random
+import time
+import tracemalloc
+import unittest
+
+from board_manager import BoardManager, CompactBoardManager
+from game_logic import CHORD, FLAG, REVEAL, GameLogic
+
+# Source: Original work
+def recursive_reveal(board, row, col, revealed):
+    # The original recursive reveal_cell (without the game state), used as the reference for the flood fill
+    cell = board.get_cell(row, col)
+    if cell.is_flagged or not cell.is_covered:
+        return
+    cell.is_covered = False
+    revealed.add((row, col))
+    if cell.is_mine or cell.adjacent:
+        return
+    for nr in range(row-1, row+2):
+        for nc in range(col-1, col+2):
+            if 0 <= nr < board.size and 0 <= nc < board.size and board.get_cell(nr, nc).is_covered:
+                recursive_reveal(board, nr, nc, revealed)
+
+# Source: Original work
+def new_game(board_class, size, mines, seed, first=(0, 0)):
+    # Game on a seeded board, with the first click already made
+    game = GameLogic(board_class(size, seed=seed))
+    game.start_game(mines)
+    game.reveal_cell(*first)
+    return game
+
+# Source: Original work
+def best_time(run, setup, repeat=3):
+    # Fastest of a few timed runs with the garbage collector off, so a collection of an earlier board can't land in it
+    best = None
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run(state)
+            elapsed = time.perf_counter() - started
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+class FloodFillTest(unittest.TestCase):
+    # Source: Original work
+    def test_same_cells_as_recursive_reveal(self):
+        # Random boards with random flags, every reveal compared against the recursive version on an identical board
+        rng = random.Random(1)
+        for board_class in (BoardManager, CompactBoardManager):
+            for trial in range(60):
+                size = rng.randint(2, 25)
+                mines = rng.randint(1, size * size // 4 + 1)
+                seed = rng.randrange(2**32)
+                game = new_game(board_class, size, mines, seed, (size // 2, size // 2))
+                reference = new_game(BoardManager, size, mines, seed, (size // 2, size // 2))
+                for _ in range(size):
+                    row, col = rng.randrange(size), rng.randrange(size)
+                    if rng.random() < 0.3:
+                        game.toggle_flag(row, col)
+                        reference.board.get_cell(row, col).is_flagged = game.board.get_cell(row, col).is_flagged
+                        continue
+                    if game.game_over:
+                        break
+                    expected = set()
+                    recursive_reveal(reference.board, row, col, expected)
+                    revealed = game.reveal_cell(row, col)
+                    self.assertEqual(len(revealed), len(set(revealed)))
+                    self.assertEqual(set(revealed), expected, (board_class.__name__, trial, row, col))
+
+    # Source: Original work
+    def test_large_region_does_not_recurse(self):
+        # One empty region over a whole 1000x1000 board would be ~1M nested calls for the recursive version
+        game = GameLogic(CompactBoardManager(1000, seed=3))
+        game.start_game(1)
+        revealed = game.reveal_cell(500, 500)
+        self.assertEqual(len(revealed), 1000 * 1000 - 1)
+        self.assertTrue(game.victory)
+
+    # Source: Original work
+    def test_small_cascade_allocates_nothing_board_sized(self):
+        # A cascade of a few cells on a 2000x2000 board must not allocate anything the size of the board
+        for board_class in (CompactBoardManager, BoardManager):
+            size = 2000 if board_class is CompactBoardManager else 300
+            game = new_game(board_class, size, size * size // 5, seed=4)
+            board = game.board
+            start = next((r, c) for r in range(size) for c in range(size)
+                         if board.get_cell(r, c).is_covered and not board.get_cell(r, c).is_mine and board.get_cell(r, c).adjacent == 0)
+            tracemalloc.start()
+            revealed = game.reveal_cell(*start)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.assertLess(len(revealed), 1000)
+            self.assertLess(peak, size * size // 10, board_class.__name__)
+
+class CoveredSafeTest(unittest.TestCase):
+    # Source: Original work
+    def test_full_board_cascade_is_linear(self):
+        # Four times the cells should take about four times as long; a per-reveal board scan would make it sixteen
+        for board_class, small in ((CompactBoardManager, 300), (BoardManager, 200)):
+            def setup(size):
+                game = GameLogic(board_class(size, seed=5))
+                game.start_game(1)
+                game.board.initialize_board(1, safe_cell=(0, 0))
+                game.board_generated()
+                return game
+            timings = [best_time(lambda game: game.reveal_cell(0, 0), lambda: setup(size)) for size in (small, 2 * small)]
+            ratio = timings[1] / timings[0]
+            self.assertLess(ratio, 8, f"{board_class.__name__}: {timings[0]:.3f}s -> {timings[1]:.3f}s")
+
+    # Source: Original work
+    def test_covered_safe_matches_recount(self):
+        # After every action of random games, the running count equals a full recount of the board
+        rng = random.Random(6)
+        for board_class in (BoardManager, CompactBoardManager):
+            for _ in range(40):
+                size = rng.randint(3, 20)
+                game = GameLogic(board_class(size, seed=rng.randrange(2**32)))
+                game.start_game(rng.randint(1, size * size // 3))
+                while not game.game_over:
+                    action = REVEAL if game.first_click else rng.choice((REVEAL, REVEAL, FLAG, CHORD))
+                    game.apply_actions([(action, rng.randrange(size), rng.randrange(size))])
+                    board = game.board
+                    recount = sum(1 for r in range(size) for c in range(size)
+                                  if board.get_cell(r, c).is_covered and not board.get_cell(r, c).is_mine)
+                    self.assertEqual(game.covered_safe, recount)
+                    self.assertEqual(game.victory, recount == 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+File Name: test_infinite_board.py
+
+Description: Regression tests for the infinite board (infinite_board.py): a cascade that crosses chunk borders reveals a
+closed region with correct adjacency counts and ends the same way however small the chunk cache is, and the cache
+drops unchanged chunks (rebuilt identically from the seed) while keeping the ones the player changed.
+
+Run with: python -m unittest discover tests   (from the project root)
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- test_infinite_board.py -----
+import math
+import unittest
+
+from game_logic import GameLogic
+from infinite_board import ChunkedBoardManager
+
+CHUNK = 8  # Small chunks, so a cascade of a few dozen cells already spans several
+
+# Source: Original work
+def new_game(seed, cache_chunks=256):
+    game = GameLogic(ChunkedBoardManager(seed=seed, chunk_size=CHUNK, cache_chunks=cache_chunks))
+    game.start_game(math.inf)
+    return game
+
+# Source: Original work
+def cell_state(board, row, col):
+    # Read a cell at once, a PackedCell is only valid until the next get_cell
+    cell = board.get_cell(row, col)
+    return cell.is_mine, cell.is_covered, cell.is_flagged, cell.adjacent
+
+# Source: Original work
+def around(row, col):
+    return [(r, c) for r in (row-1, row, row+1) for c in (col-1, col, col+1) if (r, c) != (row, col)]
+
+class InfiniteBoardTest(unittest.TestCase):
+    # Source: Original work
+    def test_cascade_across_chunks(self):
+        spanning = 0
+        for seed in range(20):
+            game = new_game(seed)
+            revealed = game.reveal_cell(-1, -1) # Corner of four chunks
+            self.assertFalse(game.game_over)
+            chunks = {(r // CHUNK, c // CHUNK) for r, c in revealed}
+            spanning += len(chunks) > 1
+            board = game.board
+            for row, col in revealed:
+                mine, covered, _, adjacent = cell_state(board, row, col)
+                self.assertFalse(mine or covered)
+                self.assertEqual(adjacent, sum(cell_state(board, r, c)[0] for r, c in around(row, col)), (seed, row, col))
+                if adjacent == 0:
+                    # The region is closed: every neighbor of an empty cell was revealed too
+                    self.assertTrue(all(not cell_state(board, r, c)[1] for r, c in around(row, col)), (seed, row, col))
+            # A cache of one chunk drops and rebuilds chunks all through the cascade, the result must not change
+            evicting = new_game(seed, cache_chunks=1)
+            self.assertEqual(sorted(evicting.reveal_cell(-1, -1)), sorted(revealed))
+        self.assertGreater(spanning, 10)
+
+    # Source: Original work
+    def test_eviction_keeps_changed_chunks(self):
+        game = new_game(3, cache_chunks=4)
+        board = game.board
+        revealed = game.reveal_cell(0, 0)
+        far = [cell_state(board, 1000 + i, 1000) for i in range(CHUNK)]
+        for i in range(50): # Wander through 50 other chunks, far more than the cache holds
+            cell_state(board, -500, i * CHUNK)
+        self.assertLessEqual(board.loaded_chunks, len(board.kept) + 4)
+        self.assertTrue(all(not cell_state(board, r, c)[1] for r, c in revealed))
+        built = board.chunks_built
+        self.assertEqual([cell_state(board, 1000 + i, 1000) for i in range(CHUNK)], far)
+        self.assertGreater(board.chunks_built, built) # The far chunk was dropped and rebuilt from the seed
+
+if __name__ == "__main__":
+    unittest.main()
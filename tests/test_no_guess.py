@@ -0,0 +1,52 @@
+"""
+File Name: test_no_guess.py
+
+Description: Regression tests for the no-guess search: it stops at its time budget, and a board whose configuration
+rarely has a no-guess layout falls back to a regular board (generation_stats.accepted is False) instead of stalling the
+first click.
+
+Run with: python -m unittest discover tests   (from the project root)
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- test_no_guess.py -----
+import time
+import unittest
+
+import no_guess
+from board_manager import BoardManager
+from no_guess import generate_no_guess
+
+class NoGuessBudgetTest(unittest.TestCase):
+    # Source: Original work
+    def test_search_stops_at_time_budget(self):
+        # 15 mines on 5x5 took ~30k candidates (seconds) without a budget
+        for workers in (1, 2):
+            started = time.perf_counter()
+            seed, generation = generate_no_guess(5, 15, (2, 2), workers=workers, seed=1, time_budget=0.2)
+            elapsed = time.perf_counter() - started
+            self.assertLess(elapsed, 2.0, workers)
+            self.assertEqual(seed is not None, generation.accepted)
+
+    # Source: Original work
+    def test_board_falls_back_to_regular_layout(self):
+        # An exhausted budget still gives a playable board, with the first click safe
+        board = BoardManager(5, seed=2, no_guess=True)
+        budget = no_guess.TIME_BUDGET
+        no_guess.TIME_BUDGET = 0
+        try:
+            board.initialize_board(15, safe_cell=(2, 2))
+        finally:
+            no_guess.TIME_BUDGET = budget
+        self.assertFalse(board.generation_stats.accepted)
+        self.assertEqual(board.count_mines(), 15)
+        self.assertFalse(board.get_cell(2, 2).is_mine)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+File Name: test_save_game.py
+
+Description: Regression tests for save files: incremental saves write through a plain file object and resume to the
+same game, a full save can replace the file the loaded board is still mapped from, and a save that was cut short is
+refused on load.
+
+Run with: python -m unittest discover tests   (from the project root)
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- test_save_game.py -----
+import os
+import random
+import tempfile
+import unittest
+
+from board_manager import CompactBoardManager
+from game_logic import FLAG, REVEAL, GameLogic
+from save_game import COMPLETE_OFFSET, GameSaver, load_game, pack_cells, save_game
+
+# Source: Original work
+def play(game, rng, moves):
+    # A few random reveals and flags that don't end the game
+    size = game.board.size
+    for _ in range(moves):
+        row, col = rng.randrange(size), rng.randrange(size)
+        if game.first_click or game.board.get_cell(row, col).is_mine:
+            game.apply_actions([(FLAG, row, col)])
+        else:
+            game.apply_actions([(REVEAL, row, col)])
+
+# Source: Original work
+def state(game):
+    return pack_cells(game.board), game.flags, game.covered_safe, game.game_over, game.victory
+
+class SaveGameTest(unittest.TestCase):
+    # Source: Original work
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game.msw")
+
+    # Source: Original work
+    def tearDown(self):
+        self.directory.cleanup()
+
+    # Source: Original work
+    def new_game(self):
+        game = GameLogic(CompactBoardManager(1000, seed=8))
+        game.start_game(150000)
+        game.reveal_cell(500, 500)
+        return game
+
+    # Source: Original work
+    def test_incremental_saves_resume_the_same_game(self):
+        rng = random.Random(9)
+        game = self.new_game()
+        save_game(game, self.path)
+        loaded = load_game(self.path)
+        saver = GameSaver(loaded, self.path)
+        for _ in range(5):
+            play(loaded, rng, 5)
+            written = saver.save()
+            self.assertLess(written, 1000 * 1000 // 10)
+            self.assertEqual(state(load_game(self.path)), state(loaded))
+
+    # Source: Original work
+    def test_full_save_replaces_the_mapped_file(self):
+        game = self.new_game()
+        save_game(game, self.path)
+        loaded = load_game(self.path)
+        play(loaded, random.Random(10), 20)
+        expected = state(loaded)
+        GameSaver(loaded, self.path).save_full()
+        self.assertEqual(state(loaded), expected)
+        self.assertEqual(state(load_game(self.path)), expected)
+
+    # Source: Original work
+    def test_partial_save_is_refused(self):
+        save_game(self.new_game(), self.path)
+        with open(self.path, "r+b") as f:
+            f.seek(COMPLETE_OFFSET)
+            f.write(b"\0")
+        with self.assertRaises(ValueError):
+            load_game(self.path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,306 @@
+"""
+File Name: tui.py
+
+Description: Terminal (curses) frontend, started with python main.py --tui. It never imports tkinter, so it starts fast
+and works over SSH. Input goes through the same InputHandler as the GUI (so batching, move recording and the
+instrumentation all work), with the curses main loop standing in for Tk's idle queue: every key that is already
+waiting is read before the queued actions are applied. Only the cells that changed are redrawn, and boards bigger than
+the terminal are shown through a viewport that scrolls with the cursor. With python main.py --infinite the board is a
+ChunkedBoardManager (infinite_board.py) and the viewport scrolls in every direction without an edge.
+
+Controls: arrow keys / hjkl move, space or enter reveal, f flag, c chord, mouse clicks work too (left reveal, right
+flag, double click chord), u undo, r redo, n new game, q quit.
+
+All Collaborators: Group 4
+
+Other sources for code: Original work
+
+Date Created: 10/18/2026
+
+Last Updated: 10/18/2026
+"""
+# ----- tui.py -----
+import curses
+
+from input_handler import InputHandler
+
+# Source: Original work
+CELL_WIDTH = 2  # Screen columns per cell: the glyph and a space
+STATUS_LINES = 2  # Status and help lines under the board
+HELP = "arrows/hjkl move  space reveal  f flag  c chord  u undo  r redo  n new game  q quit"
+MOVES = {
+    curses.KEY_UP: (-1, 0), curses.KEY_DOWN: (1, 0), curses.KEY_LEFT: (0, -1), curses.KEY_RIGHT: (0, 1),
+    ord("k"): (-1, 0), ord("j"): (1, 0), ord("h"): (0, -1), ord("l"): (0, 1),
+}
+# curses color pair per adjacent count, following NUMBER_COLORS in user_interface.py as closely as 8 colors allow
+NUMBER_PAIRS = {1: 1, 2: 2, 3: 3, 4: 1, 5: 3, 6: 4, 7: 5, 8: 6}
+FLAG_PAIR = 3
+MINE_PAIR = 3
+
+class TerminalInterface:
+    """
+    curses renderer with the same update_board / show_game_over interface as UserInterface.
+
+    What is on screen is cached per screen position, so a redraw (after a move, a scroll or a resize) only writes the
+    positions whose glyph actually changed.
+    """
+
+    # Source: Original work
+    def __init__(self, screen, game, mine_count):
+        self.screen = screen  # curses main window
+        self.game = game  # GameLogic
+        self.mine_count = mine_count  # Mines of every game started from this frontend
+        self.input = None  # InputHandler, set once it exists (it needs this object first, same as the GUI)
+        self.root = self  # InputHandler schedules with ui.root.after_idle, the main loop below plays Tk's part
+        self.idle = []  # Callbacks queued by after_idle, run once the waiting keys are read
+        self.cursor = (0, 0)  # Selected (row, col)
+        self.top = 0  # First board row in the viewport
+        self.left = 0  # First board column in the viewport
+        self.drawn = {}  # (screen y, screen x) -> (glyph, attribute) currently on screen
+        self.message = ""  # Result line shown once the game is over
+        self.showing_over = False  # Whether the viewport was last drawn for a finished game
+        self.running = True
+
+    # Source: Original work
+    def after_idle(self, callback):
+        # Same contract as Tk's after_idle: run the callback once the pending input has been handled
+        self.idle.append(callback)
+
+    # Source: Original work
+    def start_game(self):
+        # New game with the same mine count, the board is generated by the first reveal
+        self.game.start_game(self.mine_count)
+        self.message = ""
+        self.showing_over = False
+        self.draw_view()
+
+    # Source: Original work
+    def on_board(self, row, col):
+        # Whether (row, col) exists, every cell does on an infinite board (size is None)
+        size = self.game.board.size
+        return size is None or (0 <= row < size and 0 <= col < size)
+
+    # Source: Original work
+    def view_size(self):
+        # Board rows and columns that fit in the terminal
+        height, width = self.screen.getmaxyx()
+        return max(height - STATUS_LINES, 1), max(width // CELL_WIDTH, 1)
+
+    # Source: Original work
+    def cell_glyph(self, row, col):
+        # (character, attribute) that shows the current state of a cell
+        game = self.game
+        if game.first_click:
+            glyph = (".", curses.A_DIM) # The board is only generated on the first click
+        else:
+            cell = game.board.get_cell(row, col)
+            if cell.is_covered:
+                if cell.is_flagged:
+                    glyph = ("F", curses.color_pair(FLAG_PAIR) | curses.A_BOLD)
+                elif cell.is_mine and game.game_over and not game.victory:
+                    glyph = ("*", curses.A_DIM) # Show the other mines once the game is lost
+                else:
+                    glyph = (".", curses.A_DIM)
+            elif cell.is_mine:
+                glyph = ("*", curses.color_pair(MINE_PAIR) | curses.A_BOLD)
+            elif cell.adjacent:
+                glyph = (str(cell.adjacent), curses.color_pair(NUMBER_PAIRS[cell.adjacent]) | curses.A_BOLD)
+            else:
+                glyph = (" ", curses.A_NORMAL)
+        if (row, col) == self.cursor:
+            glyph = (glyph[0], glyph[1] | curses.A_REVERSE)
+        return glyph
+
+    # Source: Original work
+    def draw_cell(self, row, col):
+        # Write one cell if it is in the viewport and its glyph changed
+        rows, cols = self.view_size()
+        y, x = row - self.top, (col - self.left) * CELL_WIDTH
+        if not (0 <= y < rows and 0 <= x < cols * CELL_WIDTH):
+            return
+        glyph = self.cell_glyph(row, col)
+        if self.drawn.get((y, x)) == glyph:
+            return
+        try:
+            self.screen.addstr(y, x, glyph[0], glyph[1])
+        except curses.error:
+            pass # Writing the bottom-right corner moves the cursor off screen, the character is still drawn
+        self.drawn[(y, x)] = glyph
+
+    # Source: Original work
+    def draw_view(self):
+        # Draw every cell in the viewport (unchanged positions are skipped by draw_cell), then the status lines
+        rows, cols = self.view_size()
+        for row in range(self.top, self.top + rows):
+            for col in range(self.left, self.left + cols):
+                if self.on_board(row, col):
+                    self.draw_cell(row, col)
+        self.draw_status()
+
+    # Source: Original work
+    def draw_status(self):
+        # Status line (mines, flags, cursor position or the result) and the help line
+        height, width = self.screen.getmaxyx()
+        game = self.game
+        row, col = self.cursor
+        if game.board.size is None:
+            counts = f"Flags: {game.flags}" # No mine total on an infinite board
+        else:
+            counts = f"Mines: {game.total_mines} | Flags remaining: {game.total_mines - game.flags}"
+        status = game.game_over and self.message or f"{counts} | Cell {row + 1},{col + 1}"
+        for y, text in ((height - 2, status), (height - 1, HELP)):
+            if y < 0:
+                continue
+            self.screen.move(y, 0)
+            self.screen.clrtoeol()
+            try:
+                self.screen.addstr(y, 0, text[:width - 1])
+            except curses.error:
+                pass
+        # The status lines don't go through the cache, make sure board cells drawn there get redrawn after a resize
+        for key in [key for key in self.drawn if key[0] >= height - STATUS_LINES]:
+            del self.drawn[key]
+
+    # Source: Original work
+    def update_board(self, changed=None):
+        # Redraw the changed (row, col) cells that are in the viewport, or the whole viewport when changed is None
+        if changed is None or self.game.game_over != self.showing_over:
+            # Moving in or out of a lost game shows or hides every mine
+            self.showing_over = self.game.game_over
+            self.draw_view()
+            return
+        for row, col in changed:
+            self.draw_cell(row, col)
+        self.draw_status()
+
+    # Source: Original work
+    def show_game_over(self, victory):
+        # Show the result, and the remaining mines after a loss
+        self.message = ("You win!" if victory else "Game over!") + f" {self.input.duration:.1f}s  n: new game, q: quit"
+        if not victory:
+            self.draw_view()
+        self.draw_status()
+
+    # Source: Original work
+    def move_cursor(self, dr, dc):
+        # Move the selection, scrolling the viewport just enough to keep it visible
+        size = self.game.board.size
+        old = self.cursor
+        self.cursor = (old[0] + dr, old[1] + dc)
+        if size is not None:
+            self.cursor = (min(max(self.cursor[0], 0), size - 1), min(max(self.cursor[1], 0), size - 1))
+        rows, cols = self.view_size()
+        row, col = self.cursor
+        top = min(max(self.top, row - rows + 1), row)
+        left = min(max(self.left, col - cols + 1), col)
+        if (top, left) != (self.top, self.left):
+            self.top, self.left = top, left
+            self.draw_view()
+        else:
+            self.draw_cell(*old)
+            self.draw_cell(row, col)
+            self.draw_status()
+
+    # Source: Original work
+    def cell_at(self, y, x):
+        # Board cell under a screen position, or None
+        row, col = self.top + y, self.left + x // CELL_WIDTH
+        rows, _ = self.view_size()
+        return (row, col) if y < rows and self.on_board(row, col) else None
+
+    # Source: Original work
+    def handle_key(self, key):
+        # Act on one key press (or mouse event)
+        if key in MOVES:
+            self.move_cursor(*MOVES[key])
+        elif key in (ord(" "), ord("\n"), curses.KEY_ENTER):
+            self.input.handle_left_click(*self.cursor)
+        elif key == ord("f"):
+            self.input.handle_right_click(*self.cursor)
+        elif key == ord("c"):
+            self.input.handle_chord(*self.cursor)
+        elif key == ord("u"):
+            self.input.handle_undo()
+        elif key == ord("r"):
+            self.input.handle_redo()
+        elif key == ord("n"):
+            self.start_game()
+        elif key == ord("q"):
+            self.running = False
+        elif key == curses.KEY_RESIZE:
+            self.screen.erase()
+            self.drawn.clear()
+            self.move_cursor(0, 0) # Pull the viewport back over the cursor
+            self.draw_view()
+        elif key == curses.KEY_MOUSE:
+            try:
+                _, x, y, _, buttons = curses.getmouse()
+            except curses.error:
+                return
+            cell = self.cell_at(y, x)
+            if cell is None:
+                return
+            self.move_cursor(cell[0] - self.cursor[0], cell[1] - self.cursor[1])
+            if buttons & curses.BUTTON1_DOUBLE_CLICKED:
+                self.input.handle_chord(*cell)
+            elif buttons & curses.BUTTON1_CLICKED:
+                self.input.handle_left_click(*cell)
+            elif buttons & curses.BUTTON3_CLICKED:
+                self.input.handle_right_click(*cell)
+
+    # Source: Original work
+    def run(self, first_frame_exit=False):
+        """
+        Main loop: wait for a key, read every other key that is already waiting, run the idle callbacks (the batched
+        game actions and their redraws), then push all screen changes out at once.
+
+        Input: Whether to return right after the first frame (used to benchmark start-up)
+
+        Output: None
+        """
+        self.start_game()
+        curses.doupdate()
+        if first_frame_exit:
+            return
+        while self.running:
+            self.screen.nodelay(False)
+            key = self.screen.getch()
+            self.screen.nodelay(True)
+            while key != -1 and self.running:
+                self.handle_key(key)
+                key = self.screen.getch()
+            while self.idle:
+                self.idle.pop(0)()
+            self.screen.noutrefresh()
+            curses.doupdate()
+
+# Source: Original work
+def setup_screen(screen):
+    # Terminal settings for the game: no echo, hidden cursor, keypad and mouse input, colors if the terminal has them
+    curses.curs_set(0)
+    screen.keypad(True)
+    curses.mousemask(curses.BUTTON1_CLICKED | curses.BUTTON1_DOUBLE_CLICKED | curses.BUTTON3_CLICKED)
+    if curses.has_colors():
+        curses.start_color()
+        curses.use_default_colors()
+        for pair, color in enumerate((curses.COLOR_BLUE, curses.COLOR_GREEN, curses.COLOR_RED, curses.COLOR_CYAN,
+                                      curses.COLOR_MAGENTA, curses.COLOR_YELLOW), 1):
+            curses.init_pair(pair, color, -1)
+
+# Source: Original work
+def run_tui(game, mine_count, recorder=None, first_frame_exit=False, history=None, store=None):
+    """
+    Plays in the terminal until the player quits.
+
+    Input: GameLogic, mines per game, optional MoveRecorder, whether to exit after the first frame, optional GameHistory and
+        optional StatsStore
+
+    Output: None
+    """
+    def play(screen):
+        setup_screen(screen)
+        ui = TerminalInterface(screen, game, mine_count)
+        ui.input = InputHandler(game, ui, recorder, history, store)
+        ui.run(first_frame_exit)
+
+    curses.wrapper(play)
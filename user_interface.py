@@ -17,6 +17,8 @@ Last Updated: 9/18/2025
 import tkinter as tk
 from tkinter import messagebox
 
+from instrumentation import DebugOverlay, stats
+
 # Source: Original work
 # Number colors
 NUMBER_COLORS = {
@@ -30,6 +32,16 @@ NUMBER_COLORS = {
     8: 'darkorange'
 }
 
+# Source: Original work
+def column_label(col):
+    # Spreadsheet-style column name: A-Z, then AA, AB, ... so boards wider than 26 columns keep unique labels
+    label = ""
+    col += 1
+    while col:
+        col, letter = divmod(col - 1, 26)
+        label = chr(65 + letter) + label
+    return label
+
 class UserInterface:
     # Source: Original work combined with ChatGPT
     def __init__(self, root, game_logic, input_handler):
@@ -37,10 +49,15 @@ class UserInterface:
         self.game = game_logic  # Game logic
         self.input = input_handler  # Left and right click actions
         self.buttons = []  # Button Widgets
+        self.rendered = []  # Last appearance drawn on each button, so unchanged buttons can be skipped
+        self.button_size = None  # Last (width, height, font size) applied by update_size
+        cells = self.game.board.size * self.game.board.size
+        self.max_mines = min(max(20, cells // 5), cells - 1)  # 20 on the standard 10x10 board, scales up for bigger boards, at least one safe cell
+        self.min_mines = min(10, self.max_mines)  # Smallest mine count accepted by the prompt
         
         # Header: mine input + start
         self.header_frame = tk.Frame(self.root)
-        self.mine_label = tk.Label(self.header_frame, text="Enter number of mines (10-20):", font=("Segoe UI", 11))
+        self.mine_label = tk.Label(self.header_frame, text=f"Enter number of mines ({self.min_mines}-{self.max_mines}):", font=("Segoe UI", 11))
         self.mine_entry = tk.Entry(self.header_frame, width=5, font=("Segoe UI", 11))
         self.mine_entry.insert(0, "10")
         self.mine_entry.bind("<Return>", lambda event: self.start_game())  # Bind Enter key to start game
@@ -54,6 +71,14 @@ class UserInterface:
         self.root.bind("<F11>", self.toggle_fullscreen)
         self.root.bind("<Escape>", self.exit_fullscreen)
         self.root.bind("<Configure>", self.update_size)  # Adjust button sizes on window resize
+        # Debug overlay and cProfile capture (see instrumentation.py)
+        self.overlay = DebugOverlay(self.root)
+        self.root.bind("<F12>", self.overlay.toggle)
+        self.root.bind("<F10>", lambda event: stats.toggle_profile())
+        # Undo/redo (see history.py), the input handler is only attached after the UI is built
+        self.root.bind("<Control-z>", lambda event: self.input.handle_undo())
+        self.root.bind("<Control-y>", lambda event: self.input.handle_redo())
+        self.root.bind("<F9>", self.show_stats)  # Stats and best times of the current board (see stats_store.py)
         self.fullscreen_label = tk.Label(self.root, text="(F11: Fullscreen, Esc: Exit Fullscreen)", font=("Segoe UI", 9))
         self.fullscreen_label.pack(side=tk.BOTTOM, padx=10)
 
@@ -70,10 +95,10 @@ class UserInterface:
         # Start game after validating mine input
         try:
             mines = int(self.mine_entry.get())
-            if mines < 10 or mines > 20:
+            if mines < self.min_mines or mines > self.max_mines:
                 raise ValueError
         except ValueError:
-            messagebox.showerror("Invalid Input", "Please enter a number between 10 and 20.")
+            messagebox.showerror("Invalid Input", f"Please enter a number between {self.min_mines} and {self.max_mines}.")
             return
 
         self.hide_mine_prompt()
@@ -108,10 +133,10 @@ class UserInterface:
         # Remove any old widgets
         self.clear_board_widgets()
 
-        # Column header from A-J
+        # Column header from A-J (AA, AB, ... past Z on bigger boards)
         tk.Label(self.grid_frame, text="").grid(row=0, column=0)
         for c in range(self.game.board.size):
-            tk.Label(self.grid_frame, text=chr(65+c), font=("Segoe UI", 10, "bold")).grid(row=0, column=c+1)
+            tk.Label(self.grid_frame, text=column_label(c), font=("Segoe UI", 10, "bold")).grid(row=0, column=c+1)
             
         # Row labels and clickable cells
         for r in range(self.game.board.size):
@@ -122,9 +147,12 @@ class UserInterface:
                                 command=lambda r=r, c=c: self.input.handle_left_click(r, c))
                 btn.bind("<Button-3>", lambda e, r=r, c=c: self.input.handle_right_click(r, c))
                 btn.bind("<Button-2>", lambda e, r=r, c=c: self.input.handle_right_click(r, c))
+                btn.bind("<Double-Button-1>", lambda e, r=r, c=c: self.input.handle_chord(r, c))
                 btn.grid(row=r+1, column=c+1)
                 row_buttons.append(btn)
             self.buttons.append(row_buttons)
+            self.rendered.append([None] * self.game.board.size)
+        self.button_size = None
 
     # Source: Original work combined with github copilot
     def update_size(self, event=None):
@@ -137,35 +165,49 @@ class UserInterface:
         if not self.buttons or len(self.buttons) != self.game.board.size or any(len(row) != self.game.board.size for row in self.buttons):
             return
 
+        # <Configure> fires constantly while the window moves, only touch the buttons when the size actually changes
+        if self.button_size == (btn_width, btn_height, font_size):
+            return
+        self.button_size = (btn_width, btn_height, font_size)
+
         for r in range(self.game.board.size):
             for c in range(self.game.board.size):
                 btn = self.buttons[r][c]
                 btn.config(width=btn_width, height=btn_height, font=("Segoe UI", font_size, "bold"))
 
     # Source: Original work combined with ChatGPT
-    def update_board(self):
-        # Refresh grid based on the state of the game
-        for r in range(self.game.board.size):
-            for c in range(self.game.board.size):
-                cell = self.game.board.get_cell(r, c)
-                btn = self.buttons[r][c]
-                if not cell.is_covered:
-                    # revealed tile: visually disabled/sunken
-                    btn.config(state="disabled", relief=tk.SUNKEN, bg="lightgrey")
-                    if cell.is_mine:
-                        btn.config(text="💣", disabledforeground="red")
-                    elif cell.adjacent > 0:
-                        btn.config(text=str(cell.adjacent), disabledforeground=NUMBER_COLORS[cell.adjacent])
-                    else:
-                        btn.config(text="")
-                else:
-                    # covered tile
-                    btn.config(state="normal", relief=tk.RAISED, bg="SystemButtonFace")
-                    if cell.is_flagged:
-                        btn.config(text="🚩")
-                    else:
-                        btn.config(text="")
-        
+    def cell_appearance(self, cell):
+        # Button options that show the current state of a cell
+        if not cell.is_covered:
+            # revealed tile: visually disabled/sunken
+            if cell.is_mine:
+                return (("state", "disabled"), ("relief", tk.SUNKEN), ("bg", "lightgrey"), ("text", "💣"), ("disabledforeground", "red"))
+            elif cell.adjacent > 0:
+                return (("state", "disabled"), ("relief", tk.SUNKEN), ("bg", "lightgrey"), ("text", str(cell.adjacent)), ("disabledforeground", NUMBER_COLORS[cell.adjacent]))
+            return (("state", "disabled"), ("relief", tk.SUNKEN), ("bg", "lightgrey"), ("text", ""))
+        # covered tile
+        return (("state", "normal"), ("relief", tk.RAISED), ("bg", "SystemButtonFace"), ("text", "🚩" if cell.is_flagged else ""))
+
+    # Source: Original work combined with ChatGPT
+    def update_board(self, changed=None):
+        # Refresh the buttons for the changed (row, col) cells, or the whole grid when changed is None
+        if changed is None:
+            changed = ((r, c) for r in range(self.game.board.size) for c in range(self.game.board.size))
+        configured = 0
+        for r, c in changed:
+            appearance = self.cell_appearance(self.game.board.get_cell(r, c))
+            # Skip the Tk round-trip if the button already shows this state
+            if self.rendered[r][c] == appearance:
+                continue
+            self.buttons[r][c].config(**dict(appearance))
+            self.rendered[r][c] = appearance
+            configured += 1
+        if stats.enabled:
+            stats.count("widgets_configured", configured)
+        self.update_status()
+
+    # Source: Original work combined with ChatGPT
+    def update_status(self):
         # Update remaining flags in header
         flags_remaining = self.game.total_mines - self.game.flags
         if not self.game.game_over:
@@ -178,7 +220,7 @@ class UserInterface:
     def show_game_over(self, victory):
         # Display win or lose and pop up to replay
         result = "You Win! 🎉" if victory else "Game Over 💥"
-        choice = messagebox.askyesnocancel(result, "Play Again?\nYes = Same Mines\nNo = Choose New Mines\nCancel = Quit")
+        choice = messagebox.askyesnocancel(result, f"Time: {self.input.duration:.1f}s\n\nPlay Again?\nYes = Same Mines\nNo = Choose New Mines\nCancel = Quit")
 
         if choice is True: 
             # Restart with same mine count
@@ -191,12 +233,22 @@ class UserInterface:
         else:
             self.root.destroy()
 
+    # Source: Original work
+    def show_stats(self, event=None):
+        # Stats of the current board size and mine count, read from the store's aggregates (F9)
+        store = self.input.store
+        if store is None:
+            messagebox.showinfo("Statistics", "Statistics are off (--no-stats)")
+            return
+        messagebox.showinfo("Statistics", store.report(self.game.board.size, self.game.total_mines))
+
     # Source: ChatGPT
     def clear_board_widgets(self):
         # Clear the whole grid
         for w in self.grid_frame.winfo_children():
             w.destroy()
         self.buttons = []
+        self.rendered = []
 
     # Source: Original work combined with github copilot
     def toggle_fullscreen(self,event=None):